@@ -46,6 +46,10 @@ from . fc_cloth_op          import FC_ClothOperator
 from . fc_boolean_mode      import FC_Boolean_Mode_Operator
 from . fc_shapes_panel      import FC_Shapes_Panel
 from . types.shape_data     import VertexData, ShapeData
+from . utils.fc_bvh_util    import register_bvh_handlers, unregister_bvh_handlers
+from . utils.fc_bool_index_util import register_bool_index_handlers, unregister_bool_index_handlers
+from . utils.fc_bool_queue_util import register_bool_queue, unregister_bool_queue
+from . utils.fc_draw_utils  import clear_batch_cache
 
 from .types.enums import *
 
@@ -57,11 +61,21 @@ bpy.types.Scene.apply_bool    = BoolProperty(
                                       description="Apply bool operation immediately",
                                       default = True)
 
+bpy.types.Scene.apply_bool_deferred = BoolProperty(
+                                      name="Apply when idle", 
+                                      description="Apply pending bool operations in the background when idle",
+                                      default = False)
+
 bpy.types.Scene.delete_on_apply   = BoolProperty(
                                       name="Delete after apply", 
                                       description="Delete the object after apply",
                                       default = True)
 
+bpy.types.Scene.skip_untouched = BoolProperty(
+                                      name="Skip untouched", 
+                                      description="Primitive mode: delete or hide a cutter that can't touch the target instead of applying it",
+                                      default = False)
+
 bpy.types.Scene.self_intersect = BoolProperty(
     
                                       name="Self intersect", 
@@ -90,6 +104,11 @@ bpy.types.WindowManager.in_symmetry_mode = BoolProperty(name="Symmetry Mode",
 bpy.types.WindowManager.modal_running = BoolProperty(name="Modal operator running",
                                         default = False)
 
+bpy.types.Scene.bool_preview    = BoolProperty(
+                                      name="Live Preview", 
+                                      description="Preview the bool operation on the target while drawing a primitive",
+                                      default = True)
+
 bpy.types.Scene.extrude_immediate    = BoolProperty(
                                       name="Extrude Immediately", 
                                       description="Extrude primitive immediately after creation",
@@ -124,6 +143,16 @@ axis_input_method = [ ("None", "None", "", 0),
                       ("Z", "NoZne", "", 3) 
                     ]
 
+bool_solver_items = [ ("DEFAULT", "Default", "Solver from the addon preferences", 0),
+                      ("EXACT",   "Exact", "Exact solver, slow but handles overlapping geometry", 1),
+                      ("FAST",    "Fast", "Fast solver, for simple cases", 2),
+                      ("AUTO",    "Auto", "Fast solver with fallback to exact if the result is not manifold", 3)
+                    ]
+
+bpy.types.Scene.bool_solver = bpy.props.EnumProperty(items=bool_solver_items, 
+                                                   name="Solver",
+                                                   default="DEFAULT")
+
 bpy.types.Scene.bool_mode = bpy.props.EnumProperty(items=mode_items, 
                                                    name="Operation",
                                                    default="Create")
@@ -205,6 +234,10 @@ def register():
         bpy.utils.register_class(c)
 
     bpy.types.Scene.shape_list = bpy.props.CollectionProperty(type=ShapeData)
+
+    register_bvh_handlers()
+    register_bool_index_handlers()
+    register_bool_queue()
    
     # add keymap entry
     kc = bpy.context.window_manager.keyconfigs.addon
@@ -233,6 +266,11 @@ def unregister():
     
     del bpy.types.Scene.shape_list
 
+    unregister_bvh_handlers()
+    unregister_bool_index_handlers()
+    unregister_bool_queue()
+    clear_batch_cache()
+
     for c in classes:
         bpy.utils.unregister_class(c)
 
@@ -11,30 +11,29 @@ class FC_ApplyBoolOperator(Operator):
 
     @classmethod
     def poll(cls, context):
- 
-        for obj in context.view_layer.objects:
-            for modifier in obj.modifiers:
-                if modifier.name.startswith("FC_BOOL") and modifier.object in context.selected_objects:
-                    return True
+        return has_bool_modifiers(context.selected_objects, context.view_layer)
          
     def execute(self, context):
         
         obj2delete = []
         active_obj = bpy.context.view_layer.objects.active
-              
-        for obj in context.view_layer.objects:
-            for modifier in obj.modifiers[:]:
-                if modifier.name.startswith("FC_BOOL"):
 
-                    # API change 2.8: bpy.context.scene.objects.active = obj
-                    if modifier.object in context.selected_objects:
+        # Modifier names per target, applied in stack order below
+        bool_mods = {}
+        for cutter in context.selected_objects:
+            for target, modifier in get_bool_modifiers(cutter, context.view_layer):
 
-                        if is_delete_after_apply():
-                            if modifier.object not in obj2delete:
-                                obj2delete.append(modifier.object)
+                if is_delete_after_apply():
+                    if cutter not in obj2delete:
+                        obj2delete.append(cutter)
 
-                        bpy.context.view_layer.objects.active = obj
-                        bpy.ops.object.modifier_apply(modifier=modifier.name)
+                bool_mods.setdefault(target, set()).add(modifier.name)
+
+        for target, mod_names in bool_mods.items():
+            for modifier in target.modifiers[:]:
+                if modifier.name in mod_names:
+                    bpy.context.view_layer.objects.active = target
+                    bpy.ops.object.modifier_apply(modifier=modifier.name)
 
         bpy.ops.object.select_all(action='DESELECT')
 
@@ -81,11 +80,19 @@ class FC_ApplyAllBoolOperator(Operator):
                     return True
 
     def apply_all_modifiers_with_object(self, context, mod_name, mod_obj):
-        for obj in context.view_layer.objects:
-            for modifier in obj.modifiers[:]:
-                if modifier.name == mod_name and modifier.object is mod_obj:
-                    bpy.context.view_layer.objects.active = obj
-                    bpy.ops.object.modifier_apply(modifier=mod_name)
+        # Modifiers without object are not indexed
+        if mod_obj is None:
+            for obj in context.view_layer.objects:
+                for modifier in obj.modifiers[:]:
+                    if modifier.name == mod_name and modifier.object is None:
+                        bpy.context.view_layer.objects.active = obj
+                        bpy.ops.object.modifier_apply(modifier=mod_name)
+            return
+
+        for target, modifier in get_bool_modifiers(mod_obj, context.view_layer):
+            if modifier.name == mod_name:
+                bpy.context.view_layer.objects.active = target
+                bpy.ops.object.modifier_apply(modifier=mod_name)
 
     def execute(self, context):
         
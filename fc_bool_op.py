@@ -1,7 +1,8 @@
 import bpy
 from bpy.types import Operator
+from bpy.props import *
 
-from .utils.fc_bool_util import execute_boolean_op, execute_slice_op, select_active
+from .utils.fc_bool_util import execute_boolean_selected, execute_slice_op, select_active, prefilter_items
 
 def check_cutter_selected(context):
     result = len(context.selected_objects) > 0
@@ -13,8 +14,13 @@ def check_cutter_selected(context):
 class FC_BoolOperator_Diff(Operator):
     bl_idname = "object.bool_diff"
     bl_label = "Bool difference"
-    bl_description = "Difference for 2 selected objects" 
+    bl_description = "Difference for the selected objects" 
     bl_options = {'REGISTER', 'UNDO'} 
+
+    prefilter : EnumProperty(items=prefilter_items, 
+                             name="Skip Untouched",
+                             description="Skip cutters that can't touch the target",
+                             default="BOUNDS")
         
     @classmethod
     def poll(cls, context):
@@ -26,7 +32,9 @@ class FC_BoolOperator_Diff(Operator):
             current_mode = context.object.mode 
             bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
 
-            execute_boolean_op(context, target_obj, 0)
+            skipped = execute_boolean_selected(context, target_obj, 0, self.prefilter)
+            if skipped > 0:
+                self.report({'INFO'}, "Skipped %d cutter(s) not touching the target" % skipped)
 
             select_active(target_obj)
 
@@ -40,7 +48,7 @@ class FC_BoolOperator_Diff(Operator):
 class FC_BoolOperator_Union(Operator):
     bl_idname = "object.bool_union"
     bl_label = "Bool union"
-    bl_description = "Union for 2 selected objects" 
+    bl_description = "Union for the selected objects" 
     bl_options = {'REGISTER', 'UNDO'} 
          
     @classmethod
@@ -54,7 +62,7 @@ class FC_BoolOperator_Union(Operator):
             current_mode = context.object.mode 
             bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
 
-            execute_boolean_op(context, target_obj, 1)
+            execute_boolean_selected(context, target_obj, 1)
 
             select_active(target_obj)
             bpy.ops.object.mode_set(mode=current_mode, toggle=False)
@@ -66,7 +74,7 @@ class FC_BoolOperator_Union(Operator):
 class FC_BoolOperator_Intersect(Operator):
     bl_idname = "object.bool_intersect"
     bl_label = "Bool intersect"
-    bl_description = "Intersect for 2 selected objects" 
+    bl_description = "Intersect for the selected objects" 
     bl_options = {'REGISTER', 'UNDO'} 
          
     @classmethod
@@ -77,7 +85,7 @@ class FC_BoolOperator_Intersect(Operator):
         try:
             target_obj = bpy.context.scene.carver_target
         
-            execute_boolean_op(context, target_obj, 2)
+            execute_boolean_selected(context, target_obj, 2)
         except RuntimeError:
             pass
 
@@ -88,6 +96,11 @@ class FC_BoolOperator_Slice(Operator):
     bl_label = "Bool slice"
     bl_description = "Slice for 2 selected objects" 
     bl_options = {'REGISTER', 'UNDO'} 
+
+    prefilter : EnumProperty(items=prefilter_items, 
+                             name="Skip Untouched",
+                             description="Skip a cutter that can't touch the target",
+                             default="BOUNDS")
     
     @classmethod
     def poll(cls, context):
@@ -97,7 +110,8 @@ class FC_BoolOperator_Slice(Operator):
         try:
             target_obj = bpy.context.scene.carver_target
         
-            execute_slice_op(context, target_obj)
+            if not execute_slice_op(context, target_obj, self.prefilter):
+                self.report({'INFO'}, "Skipped cutter not touching the target")
         except RuntimeError:
             pass
 
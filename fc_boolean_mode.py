@@ -7,13 +7,15 @@ from . utils.fc_select_util import check_cutter_selected
 
 from . utils.fc_view_3d_utils import get_hit_object
 from . types.enums import next_enum
-from . fc_preferences import get_preferences
+from . fc_preferences import take_preferences_snapshot
 
 from . types.action import Action
+from . types.action_overlay import ActionOverlay
 
-from . utils.fc_bool_util import execute_slice_op, is_delete_after_apply, select_active, execute_boolean_op, get_bool_mode_id
+from . utils.fc_bool_util import execute_slice_op, is_delete_after_apply, select_active, execute_boolean_selected, get_bool_mode_id
 from . utils.fc_bevel_util import *
 from . utils.textutils import *
+from . utils.fc_redraw_util import request_redraw, request_redraw_for_event, tag_redraw_if_requested
 
 # Boolean mode operator
 class FC_Boolean_Mode_Operator(bpy.types.Operator):
@@ -46,12 +48,16 @@ class FC_Boolean_Mode_Operator(bpy.types.Operator):
 
         context.window_manager.in_primitive_mode = True    
 
+        take_preferences_snapshot()
+
         self.init_bool_mode(context)
         self.build_actions()
+        self.action_overlay = ActionOverlay(self.get_overlay_metrics)
 
         self.register_handlers(args, context)
                    
         context.window_manager.modal_handler_add(self)
+        request_redraw(context)
 
         return {"RUNNING_MODAL"}
 
@@ -59,23 +65,22 @@ class FC_Boolean_Mode_Operator(bpy.types.Operator):
 
         self.draw_handle_2d = bpy.types.SpaceView3D.draw_handler_add(
             self.draw_callback_2d, args, "WINDOW", "POST_PIXEL")
-
-        self.draw_event = context.window_manager.event_timer_add(0.1, window=context.window)
         
     def unregister_handlers(self, context):
 
         context.window_manager.in_primitive_mode = False
 
-        context.window_manager.event_timer_remove(self.draw_event)
         bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle_2d, "WINDOW")
         
         self.draw_handle_2d = None
-        self.draw_event  = None 
 
     def modal(self, context, event):
-        if context.area:
-            context.area.tag_redraw()
+        request_redraw_for_event(context, event)
+        result = self.handle_event(context, event)
+        tag_redraw_if_requested(context)
+        return result
 
+    def handle_event(self, context, event):
         result = "PASS_THROUGH"
 
         mouse_pos_2d = (event.mouse_region_x, event.mouse_region_y)
@@ -111,40 +116,12 @@ class FC_Boolean_Mode_Operator(bpy.types.Operator):
 
         return { result }
 
-    def draw_action_line(self, action, pos_y, pos_x):
-
-        prefs = get_preferences()
-        lc = prefs.osd_label_color
-        off_x = prefs.osd_offset_x
-
-        blf.color(1, lc[0], lc[1], lc[2], lc[3])
-        blf.position(1, off_x, pos_y , 1)
-
-        title = action.title
-        if action.content != "":
-            title += ":"
-
-        blf.draw(1, title) 
-     
-        if(action.content != ""):
-            blf.position(1, pos_x[0], pos_y , 1)
-            blf.draw(1, action.content) 
-
-        tc = prefs.osd_text_color
-        blf.color(1, tc[0], tc[1], tc[2], tc[3])
-        blf.position(1, pos_x[1], pos_y, 1)
-        blf.draw(1, action.id)
-        
 	  # Draw handler to paint in pixels
     def draw_callback_2d(self, op, context):
-        self.draw_actions()
+        self.action_overlay.draw(self._actions)
 
-    def draw_actions(self):
-        fsize = get_preferences().osd_font_size
-        off_x = get_preferences().osd_offset_x
+    def get_overlay_metrics(self, fsize):
         pos_y = 150
-        blf_set_size(1, fsize)
-
         line_height = 18
         pos_x = [115, 200]
 
@@ -159,11 +136,7 @@ class FC_Boolean_Mode_Operator(bpy.types.Operator):
           pos_x = [155, 270]
           pos_y -= 40
 
-        pos_x[0] += off_x
-        pos_x[1] += off_x
-
-        for index, action in enumerate(self._actions):
-          self.draw_action_line(action, (pos_y) - (index) * line_height, pos_x)
+        return pos_x, pos_y, line_height, 0
 
     def init_bool_mode(self, context):
       if context.scene.bool_mode == "Create":
@@ -187,9 +160,12 @@ class FC_Boolean_Mode_Operator(bpy.types.Operator):
             bool_id = get_bool_mode_id(bool_mode)
 
             if bool_id == 3:
-              execute_slice_op(context, target)
+              if not execute_slice_op(context, target):
+                self.report({'INFO'}, "Skipped cutter not touching the target")
             else:
-              execute_boolean_op(context, target, get_bool_mode_id(bool_mode))
+              skipped = execute_boolean_selected(context, target, bool_id)
+              if skipped > 0:
+                self.report({'INFO'}, "Skipped %d cutter(s) not touching the target" % skipped)
 
           bpy.ops.object.mode_set(mode=current_mode, toggle=False)
 
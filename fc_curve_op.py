@@ -1,6 +1,5 @@
 import bpy
 from bpy.types import Operator
-import bmesh
 
 from .widgets . bl_ui_draw_op import *
 from .widgets . bl_ui_label import * 
@@ -10,6 +9,7 @@ from .widgets . bl_ui_button import *
 from .widgets . bl_ui_checkbox import *
 
 from .utils.fc_bool_util import union_selected
+from .utils.fc_mesh_util import weld_vertices
 
 class FC_JoinAndRemesh(Operator):
     bl_idname = "view3d.join_and_remesh"
@@ -178,15 +178,9 @@ class FC_CurveAdjustOperator(BL_UI_OT_draw_operator):
         bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
         bpy.ops.object.convert(target='MESH')
 
-        bpy.ops.object.mode_set(mode='EDIT', toggle=False)
-
         obj = bpy.context.view_layer.objects.active
+        weld_vertices(obj.data, dist=0.01)
 
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.01)
-
-        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
         self.finish()
 
     def on_btn_close_down(self, widget):
@@ -1,6 +1,8 @@
 import bpy
 from bpy.types import Panel
 
+from .utils.fc_bool_queue_util import get_queue_depth, get_queue_progress
+
 class FC_PT_Panel(Panel):
     bl_space_type = "VIEW_3D"
     bl_region_type = "UI"
@@ -52,6 +54,25 @@ class FC_PT_Panel(Panel):
             col = row.column()
             col.prop(context.scene, "delete_on_apply")
 
+            # Apply pending booleans in the background
+            if not context.scene.apply_bool:
+                row = layout.row()
+                row.prop(context.scene, "apply_bool_deferred")
+            else:
+                row = layout.row()
+                row.prop(context.scene, "skip_untouched")
+
+            queue_depth = get_queue_depth()
+            if queue_depth > 0:
+                done, total = get_queue_progress()
+                row = layout.row()
+                row.label(text="Pending: %d (%d/%d applied)" % (queue_depth, done, total), icon='TIME')
+
+            # Boolean solver
+            if bpy.app.version >= (2, 91, 0):
+                row = layout.row()
+                row.prop(context.scene, "bool_solver")
+
             # Self intersect
             if bpy.app.version >= (3, 0, 0):
                 row = layout.row()
@@ -1,12 +1,49 @@
 import bpy
 
+from collections import namedtuple
+
 from bpy.props import *
 
 from bpy.types import AddonPreferences
 
+# Read only copy of the preferences used in draw callbacks
+PreferencesSnapshot = namedtuple("PreferencesSnapshot", [
+    "osd_text_color",
+    "osd_label_color",
+    "osd_font_size",
+    "osd_offset_x",
+    "symmetrize_direction"
+])
+
+_prefs_snapshot = {
+    "snapshot": None
+}
+
 def get_preferences():
     return bpy.context.preferences.addons[__package__].preferences
 
+def create_snapshot(prefs):
+    return PreferencesSnapshot(
+        tuple(prefs.osd_text_color),
+        tuple(prefs.osd_label_color),
+        prefs.osd_font_size,
+        prefs.osd_offset_x,
+        prefs.symmetrize_direction)
+
+def take_preferences_snapshot():
+    '''Called when a modal operator starts'''
+    _prefs_snapshot["snapshot"] = create_snapshot(get_preferences())
+    return _prefs_snapshot["snapshot"]
+
+def get_preferences_snapshot():
+    snapshot = _prefs_snapshot["snapshot"]
+    if snapshot is None:
+        snapshot = take_preferences_snapshot()
+    return snapshot
+
+def update_preferences_snapshot(self, context):
+    _prefs_snapshot["snapshot"] = create_snapshot(self)
+
 class FC_AddonPreferences(AddonPreferences):
     bl_idname = __package__
 
@@ -35,7 +72,8 @@ class FC_AddonPreferences(AddonPreferences):
         min=0.0,
         max=1.0,
         size=4,
-        subtype='COLOR'
+        subtype='COLOR',
+        update=update_preferences_snapshot
     )
 
     osd_label_color : FloatVectorProperty(
@@ -45,7 +83,8 @@ class FC_AddonPreferences(AddonPreferences):
         min=0.0,
         max=1.0,
         size=4,
-        subtype='COLOR'
+        subtype='COLOR',
+        update=update_preferences_snapshot
     )
 
     osd_font_size : IntProperty(
@@ -53,14 +92,16 @@ class FC_AddonPreferences(AddonPreferences):
         description="Font size of On Screen Display",
         default=16,
         min=10,
-        max=24     
+        max=24,
+        update=update_preferences_snapshot
     )
 
     osd_offset_x : IntProperty(
         name="OSD Offset X",
         description="Offset X-axis On Screen Display",
         default=60,
-        min=0   
+        min=0,
+        update=update_preferences_snapshot
     )
 
     sym_dir_items = [ ("Selected to opposite", "Selected to opposite", "",  0),
@@ -69,7 +110,17 @@ class FC_AddonPreferences(AddonPreferences):
 
     symmetrize_direction : EnumProperty(items=sym_dir_items, 
                                                    name="Symmetrize direction",
-                                                   default="Selected to opposite")
+                                                   default="Selected to opposite",
+                                                   update=update_preferences_snapshot)
+
+    bool_solver_items = [ ("EXACT", "Exact", "Exact solver, slow but handles overlapping geometry", 0),
+                          ("FAST",  "Fast",  "Fast solver, for simple cases", 1),
+                          ("AUTO",  "Auto",  "Fast solver with fallback to exact if the result is not manifold", 2)
+                        ]
+
+    bool_solver : EnumProperty(items=bool_solver_items, 
+                                                   name="Boolean solver",
+                                                   default="EXACT")
     
     def draw(self, context):
         
@@ -123,4 +174,8 @@ class FC_AddonPreferences(AddonPreferences):
             row = self.layout.row()
             row.label(text="Symmetrize direction")
             row.prop(self, "symmetrize_direction", text='')
+
+            row = self.layout.row()
+            row.label(text="Boolean solver")
+            row.prop(self, "bool_solver", text='')
         
\ No newline at end of file
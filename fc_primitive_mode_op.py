@@ -1,6 +1,5 @@
 import bpy
 import blf
-import bmesh
 
 from bpy.types import Operator
 from bpy.props import *
@@ -8,9 +7,12 @@ from bpy.props import *
 from gpu_extras.batch import batch_for_shader
 from bpy_extras import view3d_utils
 
-from .utils.fc_bool_util import select_active, execute_boolean_op, execute_slice_op, is_apply_immediate
+from .utils.fc_bool_util import select_active, execute_boolean_op, execute_slice_op, is_apply_immediate, is_delete_after_apply
 from .utils.fc_bevel_util import *
 from .utils.fc_view_3d_utils import *
+from .utils.fc_mesh_util import build_loop_mesh, weld_vertices, stamp_winding, set_origin_to_geometry
+from .utils.fc_redraw_util import request_redraw, request_redraw_for_event, tag_redraw_if_requested
+from .utils.fc_curve_util import new_curve_object, add_poly_spline, add_bezier_spline
 
 from .types.shape import *
 from .types.shape_data import *
@@ -22,10 +24,12 @@ from .types.curve_shape import *
 from .types.enums import *
 
 from .types.shape_gizmo import *
+from .types.bool_preview import BoolPreview, is_preview_object
+from .types.action_overlay import ActionOverlay
 
 from .widgets.bl_ui_textbox import *
 
-from .fc_preferences import get_preferences
+from .fc_preferences import take_preferences_snapshot
 
 from . utils.textutils import *
 
@@ -50,9 +54,10 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
     def __init__(self):
         self.draw_handle_2d = None
         self.draw_handle_3d = None
-        self.draw_event  = None
         self.shapes = []
         self.current_shape = None
+        self.bool_preview = BoolPreview()
+        self.action_overlay = ActionOverlay(self.get_overlay_metrics)
         self.add_and_set_current_shape(Polyline_Shape())
                 
     def invoke(self, context, event):
@@ -60,6 +65,8 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
 
         context.window_manager.in_primitive_mode = True
 
+        take_preferences_snapshot()
+
         self.create_shape(context)    
 
         self.shape_gizmo = Shape_Gizmo()       
@@ -67,6 +74,7 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
         self.register_handlers(args, context)
                    
         context.window_manager.modal_handler_add(self)
+        request_redraw(context)
 
         return {"RUNNING_MODAL"}
     
@@ -76,20 +84,18 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
 
         self.draw_handle_2d = bpy.types.SpaceView3D.draw_handler_add(
             self.draw_callback_2d, args, "WINDOW", "POST_PIXEL")
-
-        self.draw_event = context.window_manager.event_timer_add(0.1, window=context.window)
         
     def unregister_handlers(self, context):
 
         context.window_manager.in_primitive_mode = False
 
-        context.window_manager.event_timer_remove(self.draw_event)
+        self.bool_preview.clear()
+
         bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle_2d, "WINDOW")
         bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle_3d, "WINDOW")
         
         self.draw_handle_2d = None
         self.draw_handle_3d = None
-        self.draw_event  = None 
 
     def add_and_set_current_shape(self, new_shape):
         if self.current_shape != None:
@@ -132,14 +138,18 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
         scene.shape_list.clear()
 
     def modal(self, context, event):
-        if context.area:
-            context.area.tag_redraw()
+        request_redraw_for_event(context, event)
+        result = self.handle_event(context, event)
+        tag_redraw_if_requested(context)
+        return result
 
+    def handle_event(self, context, event):
         result = "PASS_THROUGH"
 
         RM = "RUNNING_MODAL"
 
         if self.current_shape.shape_action_widgets_handle_event(event):
+            request_redraw(context)
             return { RM }
                               
         if event.type == "ESC" and event.value == "PRESS":
@@ -182,6 +192,7 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
 
                 if self.current_shape.handle_mouse_move(mouse_pos_2d, mouse_pos_3d, event, context):
                     self.current_shape.create_batch(mouse_pos_3d)
+                    request_redraw(context)
 
         # Left mouse button is released
         if event.value == "RELEASE" and event.type == "LEFTMOUSE":
@@ -206,7 +217,7 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
                 # If an object is hit, set it as target
                 if event.ctrl:
                     hit, hit_obj = self.current_shape.is_object_hit(mouse_pos_2d_r, context)
-                    if hit:
+                    if hit and not is_preview_object(hit_obj):
                         context.scene.carver_target = hit_obj
 
                         # workround: reset bevel modifier to non display to get the right hit face
@@ -391,9 +402,46 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
 
                     self.create_shape(context)
                     result = RM
+
+        self.update_bool_preview(context)
              
         return { result }
 
+    def update_bool_preview(self, context):
+        shape = self.current_shape
+        target = context.scene.carver_target
+
+        show_preview = (context.scene.bool_preview and 
+                        context.scene.bool_mode != "Create" and
+                        target is not None and target.type == 'MESH' and
+                        shape.connected_shape() and shape.is_created())
+
+        if not show_preview:
+            if self.bool_preview.is_active():
+                self.bool_preview.clear()
+            return
+
+        # Slice shows the difference part
+        operation = 'DIFFERENCE'
+        if context.scene.bool_mode == "Union":
+            operation = 'UNION'
+        elif context.scene.bool_mode == "Intersect":
+            operation = 'INTERSECT'
+
+        self.bool_preview.update(context, target, self.get_shape_loops(), 
+                                 self.get_extrude_dir(False), operation)
+
+    def get_shape_loops(self):
+
+        # The shape, the mirror and the array copies as vertex loops
+        loops = [self.current_shape.vertices.array]
+
+        if self.current_shape.has_mirror:
+            loops.append(self.current_shape.vertices_mirror.array)
+
+        loops.extend(self.current_shape.array_vertices)
+        return loops
+
     def generate_unique_shape_name(self, base_name="Shape"):
         # Zugriff auf die shape_list des aktuellen Scenes
         scene = bpy.context.scene
@@ -456,45 +504,51 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
             bpy.ops.object.mode_set(mode='OBJECT')
 
         curve_shape = self.current_shape
-        bpy.ops.curve.primitive_nurbs_path_add(enter_editmode=True)
 
-        self.set_bevel(context.active_object)
+        # Placed at the 3D cursor like the path primitive
+        location = context.scene.cursor.location.copy()
 
-        bpy.ops.curve.select_all(action='SELECT')
-        bpy.ops.curve.delete()
+        curve = new_curve_object(context, "NurbsPath")
+        curve.location = location
 
-        for point in curve_shape.get_points():
-            bpy.ops.curve.vertex_add(location=point)
+        self.set_bevel(curve)
 
-        self.current_shape.reset()
+        add_poly_spline(curve.data, curve_shape.get_points(), location)
+
+        bpy.ops.object.mode_set(mode='EDIT')
 
+        self.current_shape.reset()
 
     def create_bezier(self, context):
         if context.object is not None:
             bpy.ops.object.mode_set(mode='OBJECT')
 
         curve_shape = self.current_shape
-        bpy.ops.curve.primitive_bezier_curve_add(enter_editmode=True, location=(0, 0, 0))
 
-        curve = context.active_object
+        curve = new_curve_object(context, "BezierCurve")
         
         self.set_bevel(curve)
 
-        bez_points = curve.data.splines[0].bezier_points
-        point_count = len(bez_points) - 1
+        start = curve_shape.get_start_point()
+        end = curve_shape.get_end_point()
 
         norm_start = curve_shape.get_normal_start()
         norm_end = curve_shape.get_normal_end()
 
-        bez_points[0].co = curve_shape.get_start_point()
+        handles_left = [None, None]
+        handles_right = [None, None]
+
         if norm_start is not None:
-            bez_points[0].handle_right = bez_points[0].co + norm_start
-            bez_points[0].handle_left = bez_points[0].co - norm_start
+            handles_left[0] = start - norm_start
+            handles_right[0] = start + norm_start
 
-        bez_points[point_count].co = curve_shape.get_end_point()
         if norm_end is not None:
-            bez_points[point_count].handle_right = bez_points[point_count].co - norm_end
-            bez_points[point_count].handle_left = bez_points[point_count].co + norm_end
+            handles_left[1] = end + norm_end
+            handles_right[1] = end - norm_end
+
+        add_bezier_spline(curve.data, (start, end), handles_left, handles_right)
+
+        bpy.ops.object.mode_set(mode='EDIT')
 
         self.current_shape.reset()
 
@@ -512,6 +566,10 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
 
     def create_mesh(self, context, extrude_mesh):
         current_mode = None
+
+        # The full resolution boolean replaces the preview
+        self.bool_preview.clear()
+
         try:
             if context.object is not None:
                 current_mode = context.object.mode
@@ -534,56 +592,28 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
             bpy.context.view_layer.objects.active = obj
             obj.select_set(state=True)
 
-            # Create a bmesh and add the vertices
-            # added by mouse clicks
-            bm = bmesh.new()
-            bm.from_mesh(mesh) 
-
-            for v in self.current_shape.vertices:
-                bm.verts.new(v)
-            
-            bm.verts.index_update()
-            bm.faces.new(bm.verts)
-
-            if self.current_shape.has_mirror:
-                # Add faces for the mirrored vertices
-                mirror_verts = []
-                for v in self.current_shape.vertices_mirror:
-                    mirror_verts.append(bm.verts.new(v))
-                
-                bm.verts.index_update()
-                bm.faces.new(mirror_verts)
-
-            for vc in self.current_shape.vertex_containers:
-
-                # Add faces for vertex containers like arrays
-                ctr_verts = []
-                for v in vc.vertices:
-                    ctr_verts.append(bm.verts.new(v))
-                
-                bm.verts.index_update()
-                bm.faces.new(ctr_verts)
+            # Add the shape, the mirror and the array copies
+            # as vertex loops in one step
+            loops = self.get_shape_loops()
 
             # Extrude mesh if extrude mesh option is enabled
+            extrude_dir = None
             if extrude_mesh:
-                self.extrude_mesh(context, bm, is_bool_create)
+                extrude_dir = self.get_extrude_dir(is_bool_create)
 
-            bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+            build_loop_mesh(mesh, loops, extrude_dir)
 
-            bm.to_mesh(mesh)
-            bm.free()
-
-            bpy.context.view_layer.objects.active = obj
-            obj.select_set(state=True)
+            weld_vertices(mesh)
 
-            self.remove_doubles()
+            # Extruded loops are closed with outward normals
+            if extrude_mesh:
+                stamp_winding(mesh)
 
             # set origin to geometry
-            bpy.ops.object.editmode_toggle()
-            bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY')
+            set_origin_to_geometry(obj)
 
             if not extrude_mesh:
-                bpy.ops.object.editmode_toggle()
+                bpy.ops.object.mode_set(mode='EDIT')
                 bpy.ops.mesh.select_all(action='SELECT')
 
             # Fast bool modes
@@ -592,11 +622,22 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
                 target_obj = bpy.context.scene.carver_target
                 if target_obj is not None:
 
+                    # Skipping cutters that can't touch the target is opt-in here
+                    prefilter = "BOUNDS" if context.scene.skip_untouched else "NONE"
+
                     bool_mode_id = self.get_bool_mode_id(context.scene.bool_mode)
                     if bool_mode_id != 3:
-                        execute_boolean_op(context, target_obj, bool_mode_id)
+                        is_applied = execute_boolean_op(context, target_obj, bool_mode_id, prefilter)
                     else:
-                        execute_slice_op(context, target_obj)
+                        is_applied = execute_slice_op(context, target_obj, prefilter)
+
+                    # The cutter can't change the target
+                    if not is_applied:
+                        self.report({'INFO'}, "Skipped cutter not touching the target")
+                        if is_delete_after_apply():
+                            bpy.data.objects.remove(obj, do_unlink=True)
+                        else:
+                            obj.hide_set(True)
 
                     # delete the bool object if apply immediate is checked
                     # Apply not needed anymore here?
@@ -624,12 +665,7 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
             return 3
         return -1
 
-    def remove_doubles(self):
-        bpy.ops.object.mode_set(mode = 'EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.remove_doubles()       
-
-    def extrude_mesh(self, context, bm, is_bool_create):
+    def get_extrude_dir(self, is_bool_create):
         length = 1
         if not is_bool_create:
             length = 100
@@ -639,42 +675,12 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
         if self.current_shape.is_extruded():
             dir = self.current_shape.get_dir() * self.current_shape.extrusion
 
-        # extr_geom = bm.edges[:]
-        extr_geom = bm.faces[:]
-
-        r = bmesh.ops.extrude_face_region(bm, geom=extr_geom)
-        verts = [e for e in r['geom'] if isinstance(e, bmesh.types.BMVert)]
-        bmesh.ops.translate(bm, vec=dir, verts=verts)
+        return dir
 
     def finish(self):
         self.unregister_handlers(bpy.context)
         return {"FINISHED"}
 
-    def draw_action_line(self, action, pos_y, pos_x):
-
-        prefs = get_preferences()
-        lc = prefs.osd_label_color
-        size = prefs.osd_font_size
-        off_x = prefs.osd_offset_x
-
-        blf.color(1, lc[0], lc[1], lc[2], lc[3])
-        blf.position(1, off_x, pos_y , 1)
-
-        title = action.title
-        if action.content != "":
-            title += ":"
-
-        blf.draw(1, title) 
-     
-        if(action.content != ""):
-            blf.position(1, pos_x[0], pos_y , 1)
-            blf.draw(1, action.content) 
-
-        tc = prefs.osd_text_color
-        blf.color(1, tc[0], tc[1], tc[2], tc[3])
-        blf.position(1, pos_x[1], pos_y, 1)
-        blf.draw(1, action.id)
-
 	# Draw handler to paint in pixels
     def draw_callback_2d(self, op, context):
 
@@ -687,10 +693,11 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
         self.current_shape.shape_action_widgets_draw()
 
         # Draw text for primitive mode
-        fsize = get_preferences().osd_font_size
-        off_x = get_preferences().osd_offset_x
-        blf_set_size(1, fsize)
+        self.action_overlay.draw(self.current_shape.actions)
 
+        blf.color(1, 1, 1, 1, 1)
+
+    def get_overlay_metrics(self, fsize):
         line_height = 18
         pos_x = [115, 200]
         pos_y = 150
@@ -707,16 +714,7 @@ class FC_Primitive_Mode_Operator(bpy.types.Operator):
             pos_x = [155, 270]
             pos_y = 160
 
-        pos_x[0] += off_x
-        pos_x[1] += off_x
-
-        self.draw_action_line(self.current_shape.actions[0], pos_y, pos_x)
-
-        for index in range(len(self.current_shape.actions)-1):
-            action = self.current_shape.actions[index+1]
-            self.draw_action_line(action, (pos_y - 10) - (index + 1) * line_height, pos_x)
-
-        blf.color(1, 1, 1, 1, 1)
+        return pos_x, pos_y, line_height, 10
 
     def get_actions_height(self, size):
         return len(self.current_shape.actions) * size
@@ -27,5 +27,8 @@ class FC_PT_Primitive_Panel(Panel):
             row = layout.row()
             row.prop(context.scene, "extrude_immediate", text="Extrude immediately")
 
+        row = layout.row()
+        row.prop(context.scene, "bool_preview", text="Live bool preview")
+
         row = layout.row()
         row.operator("object.fc_primitve_mode_op", text="Primitive Mode")
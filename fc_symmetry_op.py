@@ -14,9 +14,10 @@ from . types.shape_action import Shape_Action_Symmetry
 from bpy_extras.view3d_utils import location_3d_to_region_2d
 from mathutils import Vector
 
-from . fc_preferences import get_preferences
+from . fc_preferences import get_preferences_snapshot, take_preferences_snapshot
 
 from . utils.textutils import *
+from . utils.fc_redraw_util import request_redraw, request_redraw_for_event, tag_redraw_if_requested
 
 # Symmetry operator
 class FC_Symmetry_Operator(bpy.types.Operator):
@@ -38,17 +39,20 @@ class FC_Symmetry_Operator(bpy.types.Operator):
 		
     def __init__(self):
         self.draw_handle_2d = None
-        self.draw_event  = None
         self._actions = []
+        self._hover_action = None
                 
     def invoke(self, context, event):
         args = (self, context)  
 
         context.window_manager.in_symmetry_mode = True
+
+        take_preferences_snapshot()
     
         self.register_handlers(args, context)
                    
         context.window_manager.modal_handler_add(self)
+        request_redraw(context)
 
         red   = [1.00, 0.21, 0.33, 1.0]
         green = [0.54, 0.86, 0,    1.0]
@@ -72,16 +76,27 @@ class FC_Symmetry_Operator(bpy.types.Operator):
       self._actions.append(action)
 
     def modal(self, context, event):
-        if context.area:
-            context.area.tag_redraw()
+        request_redraw_for_event(context, event)
+        result = self.handle_event(context, event)
+        tag_redraw_if_requested(context)
+        return result
 
+    def handle_event(self, context, event):
         result = "PASS_THROUGH"
         mouse_pos_2d = (event.mouse_region_x, event.mouse_region_y)
 
         if event.type == "MOUSEMOVE":
+          hover_action = None
           for action in self._actions:
             is_inside = action.mouse_inside(context, event, mouse_pos_2d, None)
             action.set_hover(is_inside)
+            if is_inside:
+              hover_action = action
+
+          # Only redraw when the hovered action changed
+          if hover_action is not self._hover_action:
+            self._hover_action = hover_action
+            request_redraw(context)
 
         elif event.value == "PRESS" and event.type == "LEFTMOUSE":
           
@@ -130,16 +145,12 @@ class FC_Symmetry_Operator(bpy.types.Operator):
 
         self.draw_handle_2d = bpy.types.SpaceView3D.draw_handler_add(
             self.draw_callback_2d, args, "WINDOW", "POST_PIXEL")
-
-        self.draw_event = context.window_manager.event_timer_add(0.1, window=context.window)
         
     def unregister_handlers(self, context):
 
-        context.window_manager.event_timer_remove(self.draw_event)
         bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle_2d, "WINDOW")
         
         self.draw_handle_2d = None
-        self.draw_event  = None
 
         context.window_manager.in_symmetry_mode = False
 
@@ -154,7 +165,7 @@ class FC_Symmetry_Operator(bpy.types.Operator):
         action.set_position(pos_2d[0], pos_2d[1])
         action.draw()
 
-      prefs = get_preferences()
+      prefs = get_preferences_snapshot()
       sd = prefs.symmetrize_direction
 
       header = "- Symmetrize (Mode: " + sd + ") -"
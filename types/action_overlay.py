@@ -0,0 +1,68 @@
+import blf
+
+from .. fc_preferences import get_preferences_snapshot
+from .. utils.textutils import blf_set_size
+
+class ActionOverlay():
+    '''
+    On-screen list of the actions of a modal operator. The text is laid out
+    once when the actions or the overlay preferences change, drawing replays
+    the laid out text.
+    '''
+
+    FONT_ID = 1
+
+    def __init__(self, get_metrics):
+        # Returns the value columns, first line, line height and gap after the first line for a font size
+        self._get_metrics = get_metrics
+        self._key = None
+        self._font_size = 0
+        self._runs = []
+
+    def get_key(self, actions, prefs):
+        return (tuple((action.id, action.title, action.content) for action in actions), prefs)
+
+    def layout(self, actions, prefs):
+        fsize = prefs.osd_font_size
+        off_x = prefs.osd_offset_x
+
+        pos_x, pos_y, line_height, first_gap = self._get_metrics(fsize)
+        pos_x = [pos_x[0] + off_x, pos_x[1] + off_x]
+
+        labels = []
+        ids = []
+
+        for index, action in enumerate(actions):
+            y = pos_y - index * line_height
+            if index > 0:
+                y -= first_gap
+
+            title = action.title
+            if action.content != "":
+                title += ":"
+
+            labels.append((off_x, y, title))
+
+            if action.content != "":
+                labels.append((pos_x[0], y, action.content))
+
+            ids.append((pos_x[1], y, action.id))
+
+        self._font_size = fsize
+        self._runs = [(prefs.osd_label_color, labels), (prefs.osd_text_color, ids)]
+
+    def draw(self, actions):
+        prefs = get_preferences_snapshot()
+
+        key = self.get_key(actions, prefs)
+        if key != self._key:
+            self._key = key
+            self.layout(actions, prefs)
+
+        blf_set_size(self.FONT_ID, self._font_size)
+
+        for color, items in self._runs:
+            blf.color(self.FONT_ID, *color)
+            for x, y, text in items:
+                blf.position(self.FONT_ID, x, y, 1)
+                blf.draw(self.FONT_ID, text)
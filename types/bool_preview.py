@@ -0,0 +1,246 @@
+import bpy
+import time
+import numpy as np
+
+from mathutils import Vector
+
+from ..utils.fc_mesh_util import get_vertex_coords, build_loop_mesh
+
+# Custom property of the objects created for the preview
+PREVIEW_PROP = "fc_preview"
+
+def is_preview_object(obj):
+    return obj is not None and obj.get(PREVIEW_PROP) is not None
+
+class BoolPreview:
+    '''
+    Live boolean of the current shape against a proxy of the target.
+    The proxy only contains the target faces around the cutter, the rest
+    of the target is shown by a second object while the target itself
+    is drawn as bounds. The proxy is an open patch, so the result is an
+    approximation near the crop border. Updates are throttled, a change within
+    the interval is applied later by a timer.
+    '''
+
+    # Minimum seconds between two preview updates
+    MIN_INTERVAL = 0.15
+
+    def __init__(self):
+        self._proxy = None
+        self._rest = None
+        self._cutter = None
+        self._target_name = None
+        self._target_display = None
+        self._target_data = None
+        self._crop = None
+        self._key = None
+        self._pending = None
+        self._last_update = 0.0
+
+        # Keep one callable so the timer can be found again
+        self._timer_func = self.apply_pending
+
+    def is_active(self):
+        return self._proxy is not None
+
+    def update(self, context, target, loops, extrude_dir, operation):
+        key = (target.name, operation, tuple(extrude_dir), np.concatenate(loops).tobytes())
+        if key == self._key:
+            return
+
+        if self._target_name != target.name:
+            self.clear()
+            self.create_objects(context, target)
+
+        self._key = key
+        self._pending = (target.name, loops, np.array(extrude_dir), operation)
+
+        wait = self.MIN_INTERVAL - (time.time() - self._last_update)
+        if wait > 0:
+            if not bpy.app.timers.is_registered(self._timer_func):
+                bpy.app.timers.register(self._timer_func, first_interval=wait)
+            return
+
+        self.apply_pending()
+
+    def apply_pending(self):
+        if self._pending is None or self._proxy is None:
+            return None
+
+        target_name, loops, extrude_dir, operation = self._pending
+        self._pending = None
+
+        target = bpy.data.objects.get(target_name)
+        if target is None:
+            self.clear()
+            return None
+
+        self.update_cutter(loops, extrude_dir)
+        self.update_crop(loops, extrude_dir)
+
+        bool_mod = self._proxy.modifiers[0]
+        if bool_mod.operation != operation:
+            bool_mod.operation = operation
+
+        self._last_update = time.time()
+        return None
+
+    def create_objects(self, context, target):
+        self._target_name = target.name
+
+        # World space data of the evaluated target for cropping, read once per target,
+        # so pending booleans of the target are part of the preview
+        depsgraph = context.evaluated_depsgraph_get()
+        target_eval = target.evaluated_get(depsgraph)
+        mesh = target_eval.to_mesh()
+        mat = np.array(target.matrix_world)
+
+        starts = np.empty(len(mesh.polygons), dtype=np.int32)
+        totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", starts)
+        mesh.polygons.foreach_get("loop_total", totals)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+
+        self._target_data = {
+            "co": get_vertex_coords(mesh) @ mat[:3, :3].T + mat[:3, 3],
+            "starts": starts,
+            "totals": totals,
+            "loop_verts": loop_verts
+        }
+
+        target_eval.to_mesh_clear()
+
+        self._cutter = self.new_object(context, "FC_Preview_Cutter")
+        self._cutter.display_type = 'WIRE'
+        self._cutter.hide_set(True)
+
+        self._proxy = self.new_object(context, "FC_Preview_Proxy")
+        self._rest = self.new_object(context, "FC_Preview_Rest")
+
+        bool_mod = self._proxy.modifiers.new(type="BOOLEAN", name="FC_PREVIEW")
+        bool_mod.object = self._cutter
+
+        # The exact solver tolerates the open border of the proxy
+        if bpy.app.version >= (3, 0, 0):
+            bool_mod.solver = 'EXACT'
+            bool_mod.use_hole_tolerant = True
+        elif bpy.app.version >= (2, 91, 0):
+            bool_mod.solver = 'FAST'
+
+        # The target surface would show through the cut, the target stays
+        # visible for snapping but only its bounds are drawn
+        self._target_display = target.display_type
+        target.display_type = 'BOUNDS'
+
+    def new_object(self, context, name):
+        mesh = bpy.data.meshes.new(name)
+        obj = bpy.data.objects.new(name, mesh)
+        obj[PREVIEW_PROP] = True
+        obj.hide_select = True
+        context.scene.collection.objects.link(obj)
+        return obj
+
+    def update_cutter(self, loops, extrude_dir):
+        mesh = self._cutter.data
+        mesh.clear_geometry()
+        build_loop_mesh(mesh, loops, extrude_dir)
+
+    def get_crop_axes(self, extrude_dir):
+        axis = Vector(extrude_dir).normalized()
+        u = axis.orthogonal().normalized()
+        v = axis.cross(u)
+        return np.array(u), np.array(v)
+
+    def update_crop(self, loops, extrude_dir):
+        u, v = self.get_crop_axes(extrude_dir)
+        footprint = np.concatenate(loops)
+
+        fu = footprint @ u
+        fv = footprint @ v
+        rect = np.array((fu.min(), fu.max(), fv.min(), fv.max()))
+
+        # Keep the proxy while the cutter stays inside the cropped region
+        if self._crop is not None:
+            crop_u, crop_v, crop_rect = self._crop
+            if np.allclose(crop_u, u) and np.allclose(crop_v, v):
+                if (rect[0] >= crop_rect[0] and rect[1] <= crop_rect[1] and
+                    rect[2] >= crop_rect[2] and rect[3] <= crop_rect[3]):
+                    return
+
+        # Crop with a margin, so small moves don't crop again
+        margin = 0.5 * max(rect[1] - rect[0], rect[3] - rect[2]) + 0.01
+        rect += (-margin, margin, -margin, margin)
+
+        self._crop = (u, v, rect)
+        self.build_proxy(u, v, rect)
+
+    def build_proxy(self, u, v, rect):
+        data = self._target_data
+        starts = data["starts"]
+
+        if len(starts) == 0:
+            return
+
+        # Region of each face in the crop plane
+        loop_u = (data["co"] @ u)[data["loop_verts"]]
+        loop_v = (data["co"] @ v)[data["loop_verts"]]
+
+        order = np.argsort(starts)
+        sorted_starts = starts[order]
+
+        min_u = np.empty(len(starts)); max_u = np.empty(len(starts))
+        min_v = np.empty(len(starts)); max_v = np.empty(len(starts))
+        min_u[order] = np.minimum.reduceat(loop_u, sorted_starts)
+        max_u[order] = np.maximum.reduceat(loop_u, sorted_starts)
+        min_v[order] = np.minimum.reduceat(loop_v, sorted_starts)
+        max_v[order] = np.maximum.reduceat(loop_v, sorted_starts)
+
+        mask = (max_u >= rect[0]) & (min_u <= rect[1]) & (max_v >= rect[2]) & (min_v <= rect[3])
+
+        self.fill_faces(self._proxy.data, np.flatnonzero(mask))
+        self.fill_faces(self._rest.data, np.flatnonzero(~mask))
+
+    def fill_faces(self, mesh, faces):
+        '''Replace the mesh with the given faces of the target'''
+        data = self._target_data
+        starts, totals, loop_verts = data["starts"], data["totals"], data["loop_verts"]
+
+        mesh.clear_geometry()
+        if len(faces) == 0:
+            return
+
+        # Loop indices of the faces
+        face_totals = totals[faces]
+        face_offsets = np.cumsum(face_totals) - face_totals
+        loops = np.repeat(starts[faces] - face_offsets, face_totals) + np.arange(face_totals.sum())
+
+        used_verts, face_verts = np.unique(loop_verts[loops], return_inverse=True)
+        polygons = np.split(face_verts, np.cumsum(face_totals)[:-1])
+
+        mesh.from_pydata(data["co"][used_verts].tolist(), [], [p.tolist() for p in polygons])
+        mesh.update()
+
+    def clear(self):
+        if bpy.app.timers.is_registered(self._timer_func):
+            bpy.app.timers.unregister(self._timer_func)
+
+        for obj in (self._proxy, self._rest, self._cutter):
+            if obj is not None:
+                mesh = obj.data
+                bpy.data.objects.remove(obj, do_unlink=True)
+                bpy.data.meshes.remove(mesh)
+
+        target = bpy.data.objects.get(self._target_name) if self._target_name else None
+        if target is not None and self._target_display is not None:
+            target.display_type = self._target_display
+
+        self._proxy = None
+        self._rest = None
+        self._cutter = None
+        self._target_name = None
+        self._target_display = None
+        self._target_data = None
+        self._crop = None
+        self._key = None
+        self._pending = None
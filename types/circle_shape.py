@@ -76,17 +76,15 @@ class Circle_Shape(Shape):
 
     def create_circle(self, context):
 
-        from mathutils import Matrix
-
         rv3d      = context.space_data.region_3d
         view_rot  = rv3d.view_rotation
 
-        segments = self._segments + 1
-        mul = (1.0 / (segments - 1)) * (pi * 2)
-        points = [(sin(i * mul) * self._radius, cos(i * mul) * self._radius, 0) 
-        for i in range(segments-1)]
+        angles = np.arange(self._segments) * (pi * 2 / self._segments)
+        points = np.column_stack((np.sin(angles) * self._radius, 
+                                  np.cos(angles) * self._radius, 
+                                  np.zeros(self._segments)))
 
-        rot_mat = view_rot
+        rot_mat = view_rot.to_matrix()
 
         offset = Vector()
         if self._snap_to_target and self._normal != None:
@@ -97,11 +95,11 @@ class Circle_Shape(Shape):
             # rot_mat = self._normal.to_track_quat('Z', 'X').to_matrix()
             offset = self._normal.normalized() * 0.01
 
-        self._vertex_ctr.vertices = [rot_mat @ Vector(point) + offset + self._center_3d for point in points]
+        self._vertex_ctr.vertices = points @ np.array(rot_mat).T + np.array(offset + self._center_3d)
 
         self.create_mirror()
 
-        self._vertex_ctr.vertices_2d = [get_2d_vertex(context, vertex) for vertex in self._vertex_ctr.vertices]
+        self._vertex_ctr.vertices_2d = self._view_context.project_many(self._vertex_ctr.vertices_array)
 
     def handle_mouse_press(self, mouse_pos_2d, mouse_pos_3d, event, context):
 
@@ -146,11 +144,7 @@ class Circle_Shape(Shape):
 
     def get_gizmo_pos(self):
         if self.is_created():
-            rv3d = self._view_context.region_3d
-            region = self._view_context.region
-            pos_2d = location_3d_to_region_2d(region, rv3d, self.get_gizmo_anchor_vertex())
-
-            return pos_2d
+            return self._view_context.project(self.get_gizmo_anchor_vertex())
 
         return None
 
@@ -170,9 +164,7 @@ class Circle_Shape(Shape):
         if self.is_processing() or self.is_sizing():
             self.init_text()
             
-            rv3d = self._view_context.region_3d
-            region = self._view_context.region
-            pos_text = location_3d_to_region_2d(region, rv3d, self._center_3d)
+            pos_text = self._view_context.project(self._center_3d)
 
             blf.position(2, pos_text[0] + 16, pos_text[1] + 5, 0)
             blf.draw(2, "r: {0:.3f}".format(self._radius))
@@ -1,3 +1,7 @@
+import numpy as np
+
+from mathutils import Vector
+
 class ViewRegion():
     def __init__(self, region):
         self._width = region.width
@@ -23,6 +27,77 @@ class ViewContext():
         self._is_perspective = self._region_3d.is_perspective
         self._region = ViewRegion(context.region)
 
+        # Matrices at creation time and region scale for bulk 2d / 3d conversion
+        self._view_mat_inv = np.array(self._view_mat.inverted(), dtype=np.float64)
+        self._pers_mat_inv = np.array(self._pers_mat.inverted(), dtype=np.float64)
+        self._region_half = np.array((self._region.width / 2.0, self._region.height / 2.0))
+
+    def project_many(self, vertices_3d):
+        '''
+        Converts (N, 3) world positions to (N, 2) region coordinates
+        like location_3d_to_region_2d, points behind the view are NaN.
+        Uses the current view, it can change while the operator runs.
+        '''
+        verts = np.asarray(vertices_3d, dtype=np.float64).reshape(-1, 3)
+        pers_mat = np.array(self._region_3d.perspective_matrix, dtype=np.float64)
+
+        prj = verts @ pers_mat[:, :3].T + pers_mat[:, 3]
+        w = prj[:, 3:4]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = self._region_half + self._region_half * (prj[:, :2] / w)
+
+        result[w[:, 0] <= 0.0] = np.nan
+        return result
+
+    def project(self, vertex_3d):
+        pos_2d = self.project_many(vertex_3d)[0]
+        if np.isnan(pos_2d[0]):
+            return None
+        return Vector(pos_2d)
+
+    def unproject_many(self, coords_2d, depth_location):
+        '''
+        Converts (N, 2) region coordinates to (N, 3) world positions
+        on the view plane through depth_location like region_2d_to_location_3d.
+        depth_location is one position or one per coordinate
+        '''
+        origins, directions = self.get_rays(coords_2d)
+        depth = np.asarray(depth_location, dtype=np.float64)
+
+        # Intersect with the plane facing the view
+        normal = self._view_mat_inv[:3, 2]
+        t = ((depth - origins) @ normal) / (directions @ normal)
+        return origins + directions * t[:, np.newaxis]
+
+    def get_rays(self, coords_2d):
+        '''
+        Returns origins and normalized directions of the view rays
+        through the region coordinates as (N, 3) arrays, same as
+        region_2d_to_origin_3d and region_2d_to_vector_3d per point
+        '''
+        coords = np.asarray(coords_2d, dtype=np.float64).reshape(-1, 2)
+        ndc = coords / self._region_half - 1.0
+
+        view_inv = self._view_mat_inv
+        pers_inv = self._pers_mat_inv
+
+        if self._is_perspective:
+            out = np.column_stack((ndc, np.full(len(ndc), -0.5)))
+            w = out @ pers_inv[3, :3] + pers_inv[3, 3]
+
+            origins = np.broadcast_to(view_inv[:3, 3], out.shape)
+            directions = (out @ pers_inv[:3, :3].T + pers_inv[:3, 3]) / w[:, np.newaxis] - view_inv[:3, 3]
+        else:
+            directions = np.broadcast_to(-view_inv[:3, 2], (len(ndc), 3))
+            origins = ndc[:, 0:1] * pers_inv[:3, 0] + ndc[:, 1:2] * pers_inv[:3, 1] + pers_inv[:3, 3]
+
+            if self._view_pers != 'CAMERA':
+                origins = origins - pers_inv[:3, 2]
+
+        directions = directions / np.linalg.norm(directions, axis=1)[:, np.newaxis]
+        return origins, directions
+
     @property
     def region(self):
         return self._region
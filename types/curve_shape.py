@@ -55,16 +55,10 @@ class Curve_Shape(Shape):
         if mouse_pos_3d is None or mouse_pos_2d is None:
             return 0
 
-        scene = context.scene
-        region = context.region
-        region3D = context.space_data.region_3d
+        origin, view_vector = get_origin_and_direction(mouse_pos_2d, context)
 
-        view_vector = region_2d_to_vector_3d(region,   region3D, mouse_pos_2d)
-        origin      = region_2d_to_origin_3d(region,   region3D, mouse_pos_2d)
-
-        # Get intersection with objects
-        ray_cast_param = self.get_raycast_param(context.view_layer)
-        hit, loc_hit, normal, face, *_ = scene.ray_cast(ray_cast_param, origin, view_vector)
+        # Get intersection with the target or objects
+        hit, loc_hit, normal, face, hit_obj = ray_cast_target(context, origin, view_vector)
         if hit:
             mouse_pos_3d = loc_hit
 
@@ -1,5 +1,7 @@
 from .shape import *
 
+from ..utils.fc_mesh_util import get_vertex_coords, get_boundary_loops
+
 class Polyline_Shape(Shape):
 
     def __str__(self):
@@ -21,38 +23,39 @@ class Polyline_Shape(Shape):
     def create_from_mesh(self, context):
 
         obj = context.active_object
+        if obj is None or obj.type != 'MESH':
+            return False
 
         self.set_view_context(ViewContext(context))
 
-        bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+        # Mesh data is only up to date in object mode
+        if obj.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
 
-        vertices = []
+        mesh = obj.data
+        loops = get_boundary_loops(mesh)
+        if not loops:
+            return False
 
-        bm = bmesh.from_edit_mesh(obj.data)
-        bm.verts.ensure_lookup_table()
+        mat = np.array(obj.matrix_world)
+        coords = get_vertex_coords(mesh).astype(np.float64) @ mat[:3, :3].T + mat[:3, 3]
 
-        vert = bm.verts[0]
-        prev = None
+        # The shape has one outline, use the longest loop
+        def get_perimeter(loop):
+            co = coords[loop]
+            return np.linalg.norm(co - np.roll(co, 1, axis=0), axis=1).sum()
 
-        for i in range(len(bm.verts)):
-            next = None
-            for v in [e.other_vert(vert) for e in vert.link_edges if e.is_boundary]:
-                if (v != prev):
-                    next = v
+        vertices = coords[max(loops, key=get_perimeter)]
 
-            vertices.append(obj.matrix_world @ vert.co)
+        # Skip vertices at the same position, like add_v3
+        _, first = np.unique(vertices, axis=0, return_index=True)
+        vertices = vertices[np.sort(first)]
 
-            if next == None:
-                break
-            
-            prev, vert = vert, next
-        
         self.reset()
 
-        for v in vertices:
-            self.add_v3(v)
-            self.add_v2(get_2d_vertex(context, v))
-            
+        self._vertex_ctr.vertices = vertices
+        self._vertex_ctr.vertices_2d = self._view_context.project_many(vertices)
+
         self.close()
         self.build_actions()
         self.create_batch()
@@ -67,9 +70,7 @@ class Polyline_Shape(Shape):
 
         self.add_shape_action(Shape_Operation_Action())
 
-        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
-
-        bpy.ops.object.delete(use_global=False, confirm=False)
+        bpy.data.objects.remove(obj, do_unlink=True)
 
         target_obj = bpy.context.scene.carver_target
 
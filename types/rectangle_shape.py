@@ -1,5 +1,5 @@
 from .shape import *
-from ..utils.fc_view_3d_utils import get_view_direction_by_rot_matrix, get_3d_vertex_for_2d
+from ..utils.fc_view_3d_utils import get_view_direction_by_rot_matrix
 
 class Rectangle_Shape(Shape):
 
@@ -124,18 +124,17 @@ class Rectangle_Shape(Shape):
         return self._center_3d
 
     def create_rect(self, context):
-        rv3d = context.space_data.region_3d
-        view_rot = rv3d.view_rotation
-
         self._vertex_ctr.clear_3d()
 
+        vertices_2d = [self.get_v2(i) for i in range(4)]
+
         # get missing 3d vertices
         if self._snap_to_target and self._normal != None:
-            for i in range(4):
-                self._vertex_ctr.add_vertex(self.get_3d_for_2d(self.get_v2(i), context))
+            self._vertex_ctr.vertices = self.get_3d_for_2d_many(vertices_2d, context)
         else:
-            for i in range(4):
-                self._vertex_ctr.add_vertex(get_3d_vertex(context, self.get_v2(i)))
+            # Same depth location as get_3d_vertex
+            depth = get_view_direction_by_rot_matrix(self._view_context.view_rotation) * -4
+            self._vertex_ctr.vertices = self._view_context.unproject_many(vertices_2d, depth)
 
         self.create_mirror()
     
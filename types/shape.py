@@ -1,6 +1,7 @@
 import blf
 import gpu
 import bmesh
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 
 from enum import Enum
@@ -10,6 +11,7 @@ from mathutils import Vector, geometry
 from mathutils.geometry import intersect_line_plane, intersect_point_line
 
 from ..utils.fc_view_3d_utils import *
+from ..utils.fc_bvh_util import ray_cast_target
 
 from .. utils.textutils import *
 from .. utils.shader_utils import *
@@ -34,7 +36,8 @@ from ..widgets.bl_ui_drag_panel import *
 
 from ..utils.unit_util import *
 
-from .vertex_container import VertexContainer
+from .vertex_container import VertexContainer, to_vertex_array
+from .vertex_instances import VertexInstances
 
 class Shape:
 
@@ -59,7 +62,6 @@ class Shape:
         self._mouse_y = 0.0
         self._is_extruded = False
         self._snap_to_target = False
-        self._bvhtree = None
         self._hit = None
         self._normal = None
         self._hit_face = -1
@@ -75,8 +77,8 @@ class Shape:
 
         self._current_array_action = None
 
-        # vertex containers with vertices for arrays
-        self._array = []
+        # copies of the shape vertices for arrays
+        self._array = VertexInstances(self._vertex_ctr)
 
         self.shader = get_builtin_shader('UNIFORM_COLOR', '3D')
         self.create_batch()
@@ -104,8 +106,8 @@ class Shape:
 
 
     @property
-    def vertex_containers(self):
-        return self._array
+    def array_vertices(self):
+        return self._array.instance_vertices()
 
     def draw(self, context):
         self.shader.bind()
@@ -122,8 +124,7 @@ class Shape:
             self._vertex_ctr.draw_points()
             
         # Draw arrays
-        for vc in self._array:
-            vc.draw()
+        self._array.draw()
 
     def add_shape_action(self, shape_action):
         self._shape_actions.append(shape_action)
@@ -144,14 +145,10 @@ class Shape:
 
     def shape_action_widgets_handle_event(self, event):
 
-        handled = False
-
         if self._panel_action:
-            for widget in self._panel_action.widgets:
-                if widget.handle_event(event):
-                    handled = True
+            return self._panel_action.hit_grid.handle_event(event)
 
-        return handled
+        return False
 
     def is_shape_action_active(self):
         return self._panel_action is not None
@@ -206,8 +203,7 @@ class Shape:
         self._vertex_ctr_m.clear()
 
         if self.has_mirror:
-            for vertex in self._vertex_ctr.vertices:
-                self.add_v3_mirror(vertex)
+            self._vertex_ctr_m.add_mirrored(self._vertex_ctr, self.mirror_axis)
 
             if self._is_extruded:
                 dir = self._extrusion * self.get_dir()
@@ -455,8 +451,6 @@ class Shape:
         self.create_circle_array(value)
 
     def create_circle_array(self, count: int):
-        self._array.clear()
-
         if self._cb_center_cursor.is_checked:
             CF = bpy.context.scene.cursor.location
         else:
@@ -484,12 +478,7 @@ class Shape:
             verts.append(-v1 + r * cos(t) * v1_n + r * sin(t) * v2)
             t += 2 * pi / count
     
-        for cc in verts[1:]:
-
-            vc = VertexContainer()
-            vc.add_from_container(self._vertex_ctr, cc)
-            
-            self._array.append(vc)
+        self._array.set_offsets(verts[1:])
 
         if self._is_extruded:
             self.extrude_vertices(bpy.context)
@@ -511,22 +500,17 @@ class Shape:
         self.create_array(value, distance)
 
     def create_array(self, count: int, distance: float):
-        self._array.clear()
         axis = self._current_array_action.get_axis()
 
-        for i in range(int(count)):
-
-            # inverted rotation matrix of shape matrix
-            rot_mat = self._view_context._view_mat.to_3x3().inverted()
-            if axis == 'X':
-                offset = rot_mat @ Vector((distance, 0, 0))
-            else:
-                offset = rot_mat @ Vector((0, distance, 0))     
+        # inverted rotation matrix of shape matrix
+        rot_mat = self._view_context._view_mat.to_3x3().inverted()
+        if axis == 'X':
+            offset = rot_mat @ Vector((distance, 0, 0))
+        else:
+            offset = rot_mat @ Vector((0, distance, 0))     
 
-            vc = VertexContainer()
-            vc.add_from_container(self._vertex_ctr, offset * (i+1))
-            
-            self._array.append(vc)
+        steps = np.arange(1, int(count) + 1, dtype=np.float32)
+        self._array.set_offsets(np.outer(steps, offset))
 
         if self._is_extruded:
             self.extrude_vertices(bpy.context)
@@ -553,9 +537,6 @@ class Shape:
             self.apply_size_action(textbox, context)
 
     def close_array(self):
-        for vc in self._array:
-            vc.clear()
-
         self._array.clear()
 
         self._current_array_action = None
@@ -607,14 +588,11 @@ class Shape:
 
         result = None
 
-        scene = context.scene
-
         origin, direction = get_origin_and_direction(pos_2d, context)
 
-        # Try to hit an object in the scene
+        # Try to hit the target or an object in the scene
         if self._hit is None:
-            ray_cast_param = self.get_raycast_param(context.view_layer)
-            hit, self._hit, self._normal, self._hit_face, self._hit_obj, *_ = scene.ray_cast(ray_cast_param, origin, direction)
+            hit, self._hit, self._normal, self._hit_face, self._hit_obj = ray_cast_target(context, origin, direction)
 
             if hit:
                 self._snap_to_target = True
@@ -631,9 +609,6 @@ class Shape:
         return result
 
     def initialize(self, context):
-        # if target != None:
-        #    self._bvhtree = bvhtree_from_object(context, target)
-
         self._snap_to_target = False
         self.build_actions()
 
@@ -800,16 +775,20 @@ class Shape:
     def mirror_type(self):
         return bpy.context.scene.mirror_primitive
 
+    @property
+    def mirror_axis(self):
+        if self.mirror_type == "X":
+            return 0
+        elif self.mirror_type == "Y":
+            return 1
+        return 2
+
     def get_vertex_mirror(self, vertex3d):
         if vertex3d == None or not self.has_mirror:
             return None
 
-        if self.mirror_type == "X":
-            vm = Vector((-vertex3d.x, vertex3d.y, vertex3d.z))
-        elif self.mirror_type == "Y":
-            vm = Vector((vertex3d.x, -vertex3d.y, vertex3d.z))
-        else:
-            vm = Vector((vertex3d.x, vertex3d.y, -vertex3d.z))
+        vm = vertex3d.copy()
+        vm[self.mirror_axis] = -vm[self.mirror_axis]
 
         return vm
 
@@ -863,11 +842,10 @@ class Shape:
 
     def array_offset(self, diff):
 
+        # The array copies are relative to the shape
+        # vertices, so they already follow the offset
         self.create_batch()
 
-        for vc in self._array:
-            vc.add_offset(diff)
-
     def set_center(self, axis, vec_center):
      
         if axis == "N":
@@ -962,11 +940,7 @@ class Shape:
         return location_3d_to_region_2d(region, rv3d, v3d)       
 
     def vertices_3d_to_2d(self, context):
-        for index, vertex_3d in enumerate(self._vertex_ctr.vertices):
-            rv3d = self._view_context.region_3d
-            region = self._view_context.region
-            self._vertex_ctr.vertices_2d[index] = location_3d_to_region_2d(
-                region, rv3d, vertex_3d)
+        self._vertex_ctr.vertices_2d = self._view_context.project_many(self._vertex_ctr.vertices_array)
 
     def stop_move(self, context):
 
@@ -1036,10 +1010,6 @@ class Shape:
 
         self._vertex_ctr.extrude(dir)
 
-        # Extrude vertices of array
-        for vc in self._array:
-            vc.extrude(dir)
-
         self._vertex_ctr_m.extrude(dir)
 
         self._is_extruded = True
@@ -1074,29 +1044,8 @@ class Shape:
             else:
                 self._rotation += diff
                 self._mouse_y = mouse_pos_2d[1]
-                
-            tmp_vertices_2d = []
-            ox = self._center_2d[0]
-            oy = self._center_2d[1]
-
-            for i, vertex2d in enumerate(self._vertex_ctr.vertices_2d):
-                px = vertex2d[0]
-                py = vertex2d[1]
-
-                angle = radians(-diff)
-
-                x = ox + cos(angle) * (px - ox) - sin(angle) * (py - oy)
-                y = oy + sin(angle) * (px - ox) + cos(angle) * (py - oy)
-
-                tmp_vertices_2d.append((x, y))
-
-                if not self._snap_to_target:
-                    direction = get_view_direction_by_rot_matrix(self._view_context.view_rotation)
-                    self.set_v3(i, get_3d_vertex_for_2d(self._view_context, (x, y), -direction))
-                else:
-                    self.set_v3(i, self.get_3d_for_2d((x, y), context))
 
-            self._vertex_ctr.vertices_2d = tmp_vertices_2d
+            self.rotate_vertices_2d(radians(-diff), context)
 
             self.create_mirror()
 
@@ -1138,9 +1087,6 @@ class Shape:
             diff = mouse_pos_3d - self._move_offset
             self._vertex_ctr.add_offset(diff)
 
-            for vc in self._array:
-                vc.add_offset(diff)
-
             if self.has_mirror:
                 diff_m = self.get_mirror_diff(diff)
                 self._vertex_ctr_m.add_offset(diff_m)
@@ -1152,6 +1098,45 @@ class Shape:
 
         return False
 
+    def rotate_vertices_2d(self, angle, context):
+
+        # Rotate all 2d vertices around the 2d center at once
+        rot_mat = np.array(((cos(angle), -sin(angle)), 
+                            (sin(angle),  cos(angle))))
+
+        center = np.array(self._center_2d[:2], dtype=np.float64)
+
+        vertices_2d = (self._vertex_ctr.vertices_2d.array - center) @ rot_mat.T + center
+        vertices_3d = self.get_3d_for_2d_many(vertices_2d, context)
+
+        self._vertex_ctr.vertices_2d = vertices_2d
+
+        count = min(len(vertices_3d), self._vertex_ctr.vertex_count)
+        self._vertex_ctr.vertices_array[:count] = vertices_3d[:count]
+        self._vertex_ctr.vertices.touch()
+
+    def get_3d_for_2d_many(self, vertices_2d, context):
+
+        if self._snap_to_target and self._hit is None:
+            return to_vertex_array([self.get_3d_for_2d(v, context) for v in vertices_2d], 3)
+
+        if not self._snap_to_target:
+
+            # Same depth location as get_3d_vertex_for_2d
+            depth = -get_view_direction_by_rot_matrix(self._view_context.view_rotation)
+            return self._view_context.unproject_many(vertices_2d, depth)
+
+        origins, directions = self._view_context.get_rays(vertices_2d)
+
+        # Intersect with the plane of the hit face
+        hit = np.array(self._hit)
+        normal = np.array(self._normal)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = ((hit - origins) @ normal) / (directions @ normal)
+
+        return origins + directions * t[:, np.newaxis] + normal / np.linalg.norm(normal) * 0.01
+
     def vertex_moved(self, context):
         pass
 
@@ -1212,13 +1197,7 @@ class Shape:
 
     def get_gizmo_pos(self):
         if self.is_created():
-
-            rv3d = self._view_context.region_3d
-            region = self._view_context.region
- 
-            pos_2d = location_3d_to_region_2d(region, rv3d, self.get_gizmo_anchor_vertex())
-
-            return pos_2d
+            return self._view_context.project(self.get_gizmo_anchor_vertex())
 
         return None
 
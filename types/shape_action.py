@@ -1,9 +1,9 @@
 import gpu
 from gpu_extras.batch import batch_for_shader
 
-from .. utils.fc_draw_utils import draw_circle_2d, set_poly_smooth
+from .. utils.fc_draw_utils import draw_circle_2d, set_poly_smooth, get_cached_batch, draw_cached_batch
 
-from .. fc_preferences import get_preferences
+from .. fc_preferences import get_preferences_snapshot
 
 from .. utils.shader_utils import *
 
@@ -44,20 +44,13 @@ class Shape_Size_Action(Shape_Action):
 
   def draw(self):
     set_poly_smooth()
-    self._shader.bind()
-    self._shader.uniform_float("color", (0.9, 0.0, 0.0, 1.0))
-    self._batch.draw(self._shader)
+    draw_cached_batch(self.get_batch(), self._shader, (0.9, 0.0, 0.0, 1.0), self.get_position())
     set_poly_smooth(False)
 
-  def set_position(self, x, y):
-    super().set_position(x, y)
-
-    x_r = x + 14
-    y_r = y - 12
-
+  def get_batch(self):
     indices = ((0, 1, 2), (2, 0, 3))
-    coords_middle = [(x, y - 6), (x + 7,  y_r), (x_r, y - 6), (x + 7, y)]
-    self._batch = batch_for_shader(self._shader, 'TRIS', {"pos" : coords_middle}, indices=indices)
+    coords_middle = [(0, -6), (7, -12), (14, -6), (7, 0)]
+    return get_cached_batch("size_action", self._shader, 'TRIS', {"pos" : coords_middle}, indices=indices)
 
 class Shape_Action_Symmetry(Shape_Action):
 
@@ -71,7 +64,7 @@ class Shape_Action_Symmetry(Shape_Action):
 
   def set_symmetry(self):
 
-    prefs = get_preferences()
+    prefs = get_preferences_snapshot()
     sd = prefs.symmetrize_direction
 
     if sd == 'Selected to opposite':
@@ -124,7 +117,7 @@ class Shape_Action_Symmetry(Shape_Action):
     
     blf_set_size(1, 14)
     blf.color(1, 0, 0, 0, 1)
-    dim = blf.dimensions(1, self._axis)
+    dim = get_text_dimensions(1, 14, self._axis)
     blf.position(1, self._x - dim[0] / 2, self._y - dim[1] / 2, 0)
     blf.draw(1, self._axis)
 
@@ -149,29 +142,22 @@ class Shape_Array_Action(Shape_Action):
     
   def draw(self):
     set_poly_smooth()
-    self._shader.bind()
-    self._shader.uniform_float("color", (1.0, 0.2, 0.0, 1.0))
-    self._batch.draw(self._shader)
+    draw_cached_batch(self.get_batch(), self._shader, (1.0, 0.2, 0.0, 1.0), self.get_position())
     set_poly_smooth(False)
 
-  def set_position(self, x, y):
-    super().set_position(x, y)
-
-    x_r = x + 11
-    y_b = y - 11
-
+  def get_batch(self):
     lines = []
 
     if self._axis == 'Y':
       for i in range(1, 5):
-        lines.append((x,   y + 2 - (i * 3)))
-        lines.append((x_r, y + 2 - (i * 3)))
+        lines.append((0,  2 - (i * 3)))
+        lines.append((11, 2 - (i * 3)))
     else:
       for i in range(1, 5):
-        lines.append((x + (i * 3),   y))
-        lines.append((x + (i * 3), y_b))
+        lines.append(((i * 3),   0))
+        lines.append(((i * 3), -11))
 
-    self._batch = batch_for_shader(self._shader, 'LINES', {"pos": lines})
+    return get_cached_batch(("array_action", self._axis), self._shader, 'LINES', {"pos": lines})
 
 class Shape_Mirror_Action(Shape_Action):
    
@@ -180,31 +166,23 @@ class Shape_Mirror_Action(Shape_Action):
     set_poly_smooth()
     gpu.state.line_width_set(2)
 
-    self._shader.bind()
-    self._shader.uniform_float("color", (0.8, 0.30, 1.0, 1.0))
-
-    self._batch.draw(self._shader)
+    draw_cached_batch(self.get_batch(), self._shader, (0.8, 0.30, 1.0, 1.0), self.get_position())
 
     gpu.state.line_width_set(1)
     set_poly_smooth(False)
 
-  def set_position(self, x, y):
-    super().set_position(x, y)
-
-    x_m = x + 6
-    y_t = y - 11
-
+  def get_batch(self):
     points = []
 
     # Left 
-    points.append((x_m-6, y_t))
-    points.append((x_m-6, y))
-    points.append((x_m, y - 5))
+    points.append((0, -11))
+    points.append((0, 0))
+    points.append((6, -5))
 
-    points.append((x_m+6, y))
-    points.append((x_m+6, y_t))
+    points.append((12, 0))
+    points.append((12, -11))
 
-    self._batch = batch_for_shader(self._shader, 'LINE_STRIP', {"pos": points})
+    return get_cached_batch("mirror_action", self._shader, 'LINE_STRIP', {"pos": points})
 
 
 class Shape_Operation_Action(Shape_Action):
@@ -3,6 +3,7 @@ import gpu
 from gpu_extras.batch import batch_for_shader
 
 from .. utils.shader_utils import *
+from .. utils.fc_draw_utils import get_cached_batch, draw_cached_batch
 
 class Shape_Gizmo:
 
@@ -57,31 +58,23 @@ class Shape_Gizmo:
     if gizmo_pos is None:
       return
 
-    x = gizmo_pos[0]
-    y = gizmo_pos[1]
-
-    x_r = x + 15
-    y_r = y - 15
+    position = (gizmo_pos[0], gizmo_pos[1])
 
     gpu.state.blend_set('ALPHA')
 
-    self.shader_2d.bind()
+    # The batches are in gizmo coordinates and only built once
 
     #    /\
     #    -- 
-    coords_up = [(x, y), (x + 7,  y + 15), (x + 15, y)]
-    batch_gizmo_up = batch_for_shader(self.shader_2d, 'TRIS', {"pos" : coords_up })
-
-    self.shader_2d.uniform_float("color", (0.3, 0.56, 0.94, 1.0))
-    batch_gizmo_up.draw(self.shader_2d)
+    coords_up = [(0, 0), (7, 15), (15, 0)]
+    batch_gizmo_up = get_cached_batch("gizmo_up", self.shader_2d, 'TRIS', {"pos" : coords_up })
+    draw_cached_batch(batch_gizmo_up, self.shader_2d, (0.3, 0.56, 0.94, 1.0), position)
 
     #    |\
     #    |/ 
-    coords_right = [(x_r, y_r), (x_r + 15,  y_r + 7), (x_r, y_r + 15)]
-    batch_gizmo_right = batch_for_shader(self.shader_2d, 'TRIS', {"pos" : coords_right})
-
-    self.shader_2d.uniform_float("color", (0.51, 0.78, 0.17, 1.0))
-    batch_gizmo_right.draw(self.shader_2d)
+    coords_right = [(15, -15), (30, -8), (15, 0)]
+    batch_gizmo_right = get_cached_batch("gizmo_right", self.shader_2d, 'TRIS', {"pos" : coords_right})
+    draw_cached_batch(batch_gizmo_right, self.shader_2d, (0.51, 0.78, 0.17, 1.0), position)
 
     #   0  1
     #   ----
@@ -89,10 +82,8 @@ class Shape_Gizmo:
     #   ----
     #   2  3
     indices = ((0, 1, 2), (2, 1, 3))
-    coords_middle = [(x + 1, y_r + 1), (x_r - 1,  y_r + 1), (x + 1, y_r + 14), (x_r - 1, y_r + 14)]
-    batch_gizmo_middle = batch_for_shader(self.shader_2d, 'TRIS', {"pos" : coords_middle}, indices=indices)
-
-    self.shader_2d.uniform_float("color", (0.9, 0.9, 0.9, 1.0))
-    batch_gizmo_middle.draw(self.shader_2d)
+    coords_middle = [(1, -14), (14, -14), (1, -1), (14, -1)]
+    batch_gizmo_middle = get_cached_batch("gizmo_middle", self.shader_2d, 'TRIS', {"pos" : coords_middle}, indices=indices)
+    draw_cached_batch(batch_gizmo_middle, self.shader_2d, (0.9, 0.9, 0.9, 1.0), position)
 
     gpu.state.blend_set('NONE')
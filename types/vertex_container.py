@@ -1,34 +1,166 @@
 import gpu
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 
 from mathutils import Vector
 from .. utils.shader_utils import *
 
+def to_vertex_array(values, dim):
+  if isinstance(values, VertexArray):
+    return values.array
+
+  if isinstance(values, np.ndarray):
+    return values.astype(np.float32, copy=False).reshape(-1, dim)
+
+  # None entries (e.g. points behind the view) are stored as NaN
+  rows = [(np.nan,) * dim if v is None else tuple(v)[:dim] for v in values]
+  return np.array(rows, dtype=np.float32).reshape(-1, dim)
+
+class VertexArray:
+  '''
+  Contiguous float32 (N, dim) storage with a list like interface,
+  so existing code can index, iterate and append as with a list of vectors.
+  The version is increased on every change, call touch() after writing
+  to the array directly.
+  '''
+
+  def __init__(self, dim, values=None):
+    self._dim = dim
+    self._data = np.empty((16, dim), dtype=np.float32)
+    self._count = 0
+    self._version = 0
+
+    if values is not None:
+      self.assign(values)
+
+  @property
+  def array(self):
+    return self._data[:self._count]
+
+  @property
+  def version(self):
+    return self._version
+
+  def touch(self):
+    self._version += 1
+
+  def _reserve(self, count):
+    if count > len(self._data):
+      data = np.empty((max(count, 2 * len(self._data)), self._dim), dtype=np.float32)
+      data[:self._count] = self._data[:self._count]
+      self._data = data
+
+  def _index(self, index):
+    if index < 0:
+      index += self._count
+
+    if index < 0 or index >= self._count:
+      raise IndexError("vertex index out of range")
+    return index
+
+  def assign(self, values):
+    arr = to_vertex_array(values, self._dim)
+    self._reserve(len(arr))
+    self._data[:len(arr)] = arr
+    self._count = len(arr)
+    self.touch()
+
+  def append(self, value):
+    self._reserve(self._count + 1)
+    self._count += 1
+    self[self._count - 1] = value
+
+  def extend(self, values):
+    arr = to_vertex_array(values, self._dim)
+    self._reserve(self._count + len(arr))
+    self._data[self._count:self._count + len(arr)] = arr
+    self._count += len(arr)
+    self.touch()
+
+  def clear(self):
+    self._count = 0
+    self.touch()
+
+  def copy(self):
+    return list(self)
+
+  def __len__(self):
+    return self._count
+
+  def __getitem__(self, index):
+    row = self._data[self._index(index)]
+    if np.isnan(row[0]):
+      return None
+    return Vector(row)
+
+  def __setitem__(self, index, value):
+    index = self._index(index)
+    if value is None:
+      self._data[index] = np.nan
+    else:
+      self._data[index] = tuple(value)[:self._dim]
+    self.touch()
+
+  def __iter__(self):
+    for i in range(self._count):
+      yield self[i]
+
+  def __contains__(self, value):
+    if value is None or self._count == 0:
+      return False
+
+    row = np.array(tuple(value)[:self._dim], dtype=np.float32)
+    return bool(np.any(np.all(self.array == row, axis=1)))
+
+  def __str__(self):
+    return str(self.copy())
+
 class VertexContainer:
 
   def __init__(self):
     self._shader = get_builtin_shader('UNIFORM_COLOR', '3D')
-    self._vertices = []
-    self._vertices_2d = []
-    self._vertices_extruded = []
+    self._vertices = VertexArray(3)
+    self._vertices_2d = VertexArray(2)
+    self._vertices_extruded = VertexArray(3)
+
+    # Vertex state each batch was last built from
+    self._batch_state = {}
+
+  def is_batch_dirty(self, name, state):
+    if self._batch_state.get(name) == state:
+      return False
+
+    self._batch_state[name] = state
+    return True
 
   def create_batch(self, mouse_pos = None):
-    
-    verts = self.vertices_copy
 
-    if mouse_pos != None:
-      verts.append(mouse_pos)
+    # Only the batches whose source vertices changed are rebuilt
+    mouse_state = None if mouse_pos is None else tuple(mouse_pos)
+    base_version = self._vertices.version
+    extr_version = self._vertices_extruded.version
+
+    if self.is_batch_dirty("loop", (base_version, mouse_state)):
+      verts = self._vertices.array
+
+      if mouse_pos != None:
+        verts = np.vstack((verts, to_vertex_array([mouse_pos], 3)))
 
-    self._batch = batch_for_shader(self._shader, 'LINE_LOOP', {"pos": verts})
-    self._batch_points = batch_for_shader(self._shader, 'POINTS', {"pos": verts})
+      self._batch = batch_for_shader(self._shader, 'LINE_LOOP', {"pos": verts})
+      self._batch_points = batch_for_shader(self._shader, 'POINTS', {"pos": verts})
 
-    extrude_lines = []
-    for index, vertex in enumerate(self._vertices_extruded):
-      extrude_lines.append(self._vertices[index])
-      extrude_lines.append(vertex)
+    if self.is_batch_dirty("extruded", extr_version):
+      self._batch_extruded = batch_for_shader(self._shader, 'LINE_LOOP', {"pos": self._vertices_extruded.array})
 
-    self._batch_extruded = batch_for_shader(self._shader, 'LINE_LOOP', {"pos": self._vertices_extruded})
-    self._batch_lines_extruded = batch_for_shader(self._shader, 'LINES', {"pos": extrude_lines})
+    if self.is_batch_dirty("lines", (base_version, extr_version)):
+
+      # Interleave base and extruded vertices: v0, e0, v1, e1, ...
+      extr_count = min(len(self._vertices_extruded), len(self._vertices))
+      extrude_lines = np.empty((2 * extr_count, 3), dtype=np.float32)
+      extrude_lines[0::2] = self._vertices.array[:extr_count]
+      extrude_lines[1::2] = self._vertices_extruded.array[:extr_count]
+
+      self._batch_lines_extruded = batch_for_shader(self._shader, 'LINES', {"pos": extrude_lines})
 
   def draw(self):
     self._shader.bind()
@@ -51,19 +183,13 @@ class VertexContainer:
     gpu.state.blend_set('NONE')
 
   def draw_points(self):
-    self._batch_points.draw(self._shader)  
+    self._batch_points.draw(self._shader)
 
   def add_vertex(self, vertex: Vector):
     self._vertices.append(vertex)
 
   def extrude(self, dir):
-    extr_count = len(self._vertices_extruded)
-
-    for index, vertex3d in enumerate(self._vertices):
-        if index >= extr_count:
-            self._vertices_extruded.append(vertex3d + dir)
-        else:
-            self._vertices_extruded[index] = vertex3d + dir
+    self._vertices_extruded.assign(self._vertices.array + np.asarray(dir, dtype=np.float32))
 
     self.create_batch()
 
@@ -77,24 +203,29 @@ class VertexContainer:
     self.create_batch()
 
   def add_offset(self, vec_offset):
+    offset = np.asarray(vec_offset, dtype=np.float32)
 
-    for vec in self._vertices:
-      vec += vec_offset
+    self._vertices.array[:] += offset
+    self._vertices.touch()
 
-    for vec in self._vertices_extruded:
-      vec += vec_offset
+    self._vertices_extruded.array[:] += offset
+    self._vertices_extruded.touch()
 
     self.create_batch()
 
   def add_vertices(self, vertices, offset=Vector((0.5, 0, 0))):
-    for vec in vertices:
-      v2 = vec + offset
-      self.add_vertex(v2)
+    self._vertices.extend(to_vertex_array(vertices, 3) + np.asarray(offset, dtype=np.float32))
 
   def add_from_container(self, vertex_ctr, offset=Vector((0.5, 0, 0))):
     self.add_vertices(vertex_ctr.vertices, offset)
     self.create_batch()
 
+  def add_mirrored(self, vertex_ctr, axis):
+    '''Add the vertices of vertex_ctr mirrored on the axis index (0 = X, 1 = Y, 2 = Z)'''
+    mirrored = vertex_ctr.vertices_array.copy()
+    mirrored[:, axis] *= -1
+    self._vertices.extend(mirrored)
+
   def clear(self):
     self._vertices.clear()
     self._vertices_extruded.clear()
@@ -121,13 +252,21 @@ class VertexContainer:
   def vertices(self):
       return self._vertices
 
+  @property
+  def vertices_array(self):
+      return self._vertices.array
+
+  @property
+  def vertices_extruded_array(self):
+      return self._vertices_extruded.array
+
   @property
   def vertices_2d(self):
       return self._vertices_2d
 
   @vertices_2d.setter
   def vertices_2d(self, value):
-      self._vertices_2d = value
+      self._vertices_2d.assign(value)
 
   @property
   def vertices_copy(self):
@@ -135,7 +274,7 @@ class VertexContainer:
 
   @vertices.setter
   def vertices(self, value):
-      self._vertices = value
+      self._vertices.assign(value)
 
   def __str__(self):
     return str(self._vertices)
\ No newline at end of file
@@ -0,0 +1,50 @@
+import gpu
+import numpy as np
+
+from mathutils import Matrix
+
+class VertexInstances:
+  '''
+  Copies of a vertex container stored as one 4x4 transform per copy.
+  All copies share the GPU batches of the base container, the
+  vertices of a copy are only computed when they are requested.
+  '''
+
+  def __init__(self, vertex_ctr):
+    self._vertex_ctr = vertex_ctr
+    self._transforms = np.empty((0, 4, 4), dtype=np.float32)
+    self._matrices = []
+
+  def set_transforms(self, transforms):
+    self._transforms = np.asarray(transforms, dtype=np.float32).reshape(-1, 4, 4)
+
+    # mathutils matrices for the gpu matrix stack, built once per change
+    self._matrices = [Matrix(t.tolist()) for t in self._transforms]
+
+  def set_offsets(self, offsets):
+    offsets = np.asarray(offsets, dtype=np.float32).reshape(-1, 3)
+
+    transforms = np.tile(np.identity(4, dtype=np.float32), (len(offsets), 1, 1))
+    transforms[:, :3, 3] = offsets
+    self.set_transforms(transforms)
+
+  def clear(self):
+    self.set_transforms(np.empty((0, 4, 4), dtype=np.float32))
+
+  def __len__(self):
+    return len(self._transforms)
+
+  def draw(self):
+    for matrix in self._matrices:
+      with gpu.matrix.push_pop():
+        gpu.matrix.multiply_matrix(matrix)
+        self._vertex_ctr.draw()
+
+  def instance_vertices(self):
+    '''Returns the world space vertices of all copies as (count, N, 3) array'''
+    base = self._vertex_ctr.vertices_array
+
+    rot = self._transforms[:, :3, :3]
+    loc = self._transforms[:, :3, 3]
+
+    return np.einsum('kij,nj->kni', rot, base) + loc[:, np.newaxis, :]
@@ -0,0 +1,134 @@
+import bpy
+
+from bpy.app.handlers import persistent
+
+# FC_BOOL modifiers that use a cutter object, see get_bool_modifiers
+_bool_index = {
+    "valid": False,
+
+    # cutter pointer -> {(target name, modifier name)}
+    "cutters": {},
+
+    # target name -> {modifier name: cutter pointer}
+    "targets": {}
+}
+
+def is_bool_modifier(modifier):
+    return modifier.name.startswith("FC_BOOL") and getattr(modifier, "object", None) is not None
+
+def remove_target(target_name):
+    for mod_name, cutter_key in _bool_index["targets"].pop(target_name, {}).items():
+        entries = _bool_index["cutters"].get(cutter_key)
+        if entries is not None:
+            entries.discard((target_name, mod_name))
+            if not entries:
+                del _bool_index["cutters"][cutter_key]
+
+def index_target(obj):
+    remove_target(obj.name)
+
+    modifiers = {}
+    for modifier in obj.modifiers:
+        if is_bool_modifier(modifier):
+            cutter_key = modifier.object.as_pointer()
+            modifiers[modifier.name] = cutter_key
+            _bool_index["cutters"].setdefault(cutter_key, set()).add((obj.name, modifier.name))
+
+    if modifiers:
+        _bool_index["targets"][obj.name] = modifiers
+
+def rebuild_bool_index():
+    _bool_index["cutters"].clear()
+    _bool_index["targets"].clear()
+
+    for obj in bpy.data.objects:
+        index_target(obj)
+
+    _bool_index["valid"] = True
+
+def invalidate_bool_index():
+    _bool_index["valid"] = False
+
+def lookup_bool_modifiers(cutter):
+    '''None if the index may be out of date for the cutter'''
+    entries = _bool_index["cutters"].get(cutter.as_pointer())
+
+    # A modifier added since the last depsgraph update is not indexed yet
+    if entries is None:
+        return None
+
+    result = []
+    for target_name, mod_name in entries:
+        target = bpy.data.objects.get(target_name)
+        modifier = None if target is None else target.modifiers.get(mod_name)
+
+        # Renamed or deleted since the last update
+        if modifier is None or getattr(modifier, "object", None) != cutter:
+            return None
+
+        result.append((target, modifier))
+
+    return result
+
+def filter_view_layer(result, view_layer):
+    if view_layer is None:
+        return result
+    return [(t, m) for t, m in result if view_layer.objects.get(t.name) is not None]
+
+def get_bool_modifiers(cutter, view_layer=None):
+    '''
+    Returns (target, modifier) pairs of all FC_BOOL modifiers using the cutter,
+    optionally only for targets in the view layer
+    '''
+    if not _bool_index["valid"]:
+        rebuild_bool_index()
+
+    result = lookup_bool_modifiers(cutter)
+    if result is None:
+        rebuild_bool_index()
+        result = lookup_bool_modifiers(cutter) or []
+
+    return filter_view_layer(result, view_layer)
+
+def has_bool_modifiers(cutters, view_layer=None):
+    if not _bool_index["valid"]:
+        rebuild_bool_index()
+
+    # At most one rebuild for all unknown cutters
+    results = [lookup_bool_modifiers(cutter) for cutter in cutters]
+    if any(result is None for result in results):
+        rebuild_bool_index()
+        results = [lookup_bool_modifiers(cutter) or [] for cutter in cutters]
+
+    return any(filter_view_layer(result, view_layer) for result in results)
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    if not _bool_index["valid"]:
+        return
+
+    # Adding, removing or changing a modifier updates its object
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Object):
+            index_target(update.id.original)
+
+@persistent
+def on_file_changed(dummy):
+    invalidate_bool_index()
+
+def register_bool_index_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_file_changed)
+    bpy.app.handlers.undo_post.append(on_file_changed)
+    bpy.app.handlers.redo_post.append(on_file_changed)
+
+def unregister_bool_index_handlers():
+    handlers = bpy.app.handlers
+    for handler_list, handler in ((handlers.depsgraph_update_post, on_depsgraph_update),
+                                  (handlers.load_post, on_file_changed),
+                                  (handlers.undo_post, on_file_changed),
+                                  (handlers.redo_post, on_file_changed)):
+        if handler in handler_list:
+            handler_list.remove(handler)
+
+    invalidate_bool_index()
@@ -0,0 +1,143 @@
+import bpy
+import time
+
+from bpy.app.handlers import persistent
+
+from . fc_bevel_util import has_bevel_mod
+from . fc_bool_index_util import get_bool_modifiers
+from . fc_mesh_util import set_smooth
+
+# Seconds without new booleans before the queue is applied
+IDLE_DELAY = 1.0
+
+# Pending FC_BOOL modifier names per target name, see enqueue_bool
+_bool_queue = {
+    "targets": {},
+    "total": 0,
+    "done": 0,
+    "last_change": 0.0
+}
+
+def get_queue_depth():
+    return sum(len(mod_names) for mod_names in _bool_queue["targets"].values())
+
+def get_queue_progress():
+    return _bool_queue["done"], _bool_queue["total"]
+
+def clear_bool_queue():
+    _bool_queue["targets"].clear()
+    _bool_queue["total"] = 0
+    _bool_queue["done"] = 0
+
+def enqueue_bool(target, bool_mod):
+    '''Apply the modifier of the target when the user is idle'''
+    mod_names = _bool_queue["targets"].setdefault(target.name, [])
+    if bool_mod.name not in mod_names:
+        mod_names.append(bool_mod.name)
+        _bool_queue["total"] += 1
+
+    _bool_queue["last_change"] = time.time()
+
+    if not bpy.app.timers.is_registered(process_bool_queue):
+        bpy.app.timers.register(process_bool_queue, first_interval=IDLE_DELAY)
+
+    tag_redraw_panels()
+
+def tag_redraw_panels():
+    wm = bpy.context.window_manager
+    if wm is None:
+        return
+
+    for window in wm.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+def apply_modifier(target, mod_name):
+    '''modifier_apply from a timer, which has no active object. True if applied'''
+    override = {"object": target, "active_object": target}
+
+    try:
+        if hasattr(bpy.context, "temp_override"):
+            with bpy.context.temp_override(**override):
+                bpy.ops.object.modifier_apply(modifier=mod_name)
+        else:
+            bpy.ops.object.modifier_apply(override, modifier=mod_name)
+    except RuntimeError:
+        # Linked or shape key meshes, the modifier stays pending
+        return False
+
+    return True
+
+def apply_queued_modifiers(target, mod_names):
+    '''
+    Apply the queued modifiers of the target in stack order with modifier_apply,
+    as one undo step. The other modifiers of the stack are not applied.
+    '''
+    queued = [(m.name, m.object) for m in target.modifiers if m.name in mod_names]
+
+    cutters = set()
+    for mod_name, cutter in queued:
+        if apply_modifier(target, mod_name) and cutter is not None:
+            cutters.add(cutter)
+
+    if not cutters:
+        return
+
+    if has_bevel_mod(target):
+        set_smooth(target.data)
+
+    # Delete cutters not used by other booleans anymore
+    if bpy.context.scene.delete_on_apply:
+        for cutter in cutters:
+            if not get_bool_modifiers(cutter):
+                bpy.data.objects.remove(cutter, do_unlink=True)
+
+    bpy.ops.ed.undo_push(message="Apply Booleans")
+
+def process_bool_queue():
+    targets = _bool_queue["targets"]
+    if not targets:
+        clear_bool_queue()
+        return None
+
+    # Wait until no booleans were added for a while
+    wait = IDLE_DELAY - (time.time() - _bool_queue["last_change"])
+    if wait > 0:
+        return wait
+
+    # One target per call to keep the UI responsive
+    target_name = next(iter(targets))
+    target = bpy.data.objects.get(target_name)
+
+    if target is not None and target.mode != 'OBJECT':
+        return IDLE_DELAY
+
+    mod_names = targets.pop(target_name)
+    if target is not None and target.type == 'MESH':
+        apply_queued_modifiers(target, mod_names)
+
+    _bool_queue["done"] += len(mod_names)
+    tag_redraw_panels()
+
+    if not targets:
+        clear_bool_queue()
+        return None
+
+    return 0.01
+
+@persistent
+def on_load_post(dummy):
+    clear_bool_queue()
+
+def register_bool_queue():
+    bpy.app.handlers.load_post.append(on_load_post)
+
+def unregister_bool_queue():
+    if bpy.app.timers.is_registered(process_bool_queue):
+        bpy.app.timers.unregister(process_bool_queue)
+
+    if on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load_post)
+
+    clear_bool_queue()
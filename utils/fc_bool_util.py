@@ -2,22 +2,33 @@ import bpy
 from bpy.props import *
 
 from . fc_bevel_util import *
+from . fc_bool_index_util import get_bool_modifiers, has_bool_modifiers
+from . fc_bool_queue_util import enqueue_bool
+from . fc_bvh_util import get_target_bvhtree
+from . fc_view_3d_utils import bvhtree_from_object
+from . fc_mesh_util import orient_normals_outward, set_smooth, is_point_inside
+from . fc_mesh_util import get_face_islands, get_island_points
+from . fc_mesh_util import is_manifold, mesh_from_modifiers, get_vertex_coords
+from .. fc_preferences import get_preferences
 
 import bmesh
+import numpy as np
+
+from mathutils.bvhtree import BVHTree
+from mathutils.kdtree import KDTree
+
+# Prefilter for cutters that can't touch the target
+prefilter_items = [ ("NONE",   "None",   "Always add the boolean", 0),
+                    ("BOUNDS", "Bounds", "Skip cutters whose bounding box does not overlap the target", 1),
+                    ("BVH",    "BVH",    "Skip cutters whose surface does not intersect the target and that are not inside it or around it", 2)
+                  ]
 
 def can_apply_bool(obj, context):
     target = context.scene.carver_target
     if target is None:
         return False
- 
-    bool_mod = target.modifiers.get("FC_BOOL")
-    if bool_mod is None:
-        return False
-    
-    if bool_mod.object != obj:
-        return False
 
-    return True
+    return any(bool_target == target for bool_target, _ in get_bool_modifiers(obj))
     
 
 def select_active(obj):
@@ -33,6 +44,9 @@ def select_active(obj):
 def is_apply_immediate():
     return (bpy.context.scene.apply_bool == True)
 
+def is_apply_deferred():
+    return (bpy.context.scene.apply_bool_deferred == True)
+
 def is_delete_after_apply():
     return (bpy.context.scene.delete_on_apply == True)
 
@@ -43,13 +57,14 @@ def is_hole_tolerant():
     return (bpy.context.scene.hole_tolerant == True)
 
 def recalc_normals(mesh):
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
-    bm.to_mesh(mesh)
-    bm.clear()
-    mesh.update()
-    bm.free()
+    orient_normals_outward(mesh)
+
+def get_bool_operation(bool_method):
+    if bool_method == 1:
+        return 'UNION'
+    elif bool_method == 2:
+        return 'INTERSECT'
+    return 'DIFFERENCE'
 
 def get_bool_mode_id(bool_name):
     if bool_name == "Difference":
@@ -62,20 +77,59 @@ def get_bool_mode_id(bool_name):
         return 3
     return -1
 
+def get_bool_solver():
+    solver = bpy.context.scene.bool_solver
+    if solver == "DEFAULT":
+        return get_preferences().bool_solver
+    return solver
+
+def set_bool_solver(context, target_obj, bool_mod, verify = True):
+
+    '''
+    Set the solver of the modifier by the solver policy.
+    In AUTO mode the fast solver is kept if its result is manifold and
+    changed the target. That is only evaluated when verify is set and
+    both meshes are manifold, otherwise the exact solver is used.
+    '''
+
+    if not can_use_exact_solver():
+        return
+
+    solver = get_bool_solver()
+    if solver != "AUTO":
+        bool_mod.solver = solver
+        return
+
+    bool_mod.solver = 'EXACT'
+    if not verify:
+        return
+
+    # The fast solver gives no manifold result for open meshes
+    if bool_mod.operand_type == 'COLLECTION':
+        cutters = list(bool_mod.collection.objects) if bool_mod.collection else []
+    else:
+        cutters = [bool_mod.object] if bool_mod.object else []
+
+    if not cutters or not is_manifold(target_obj.data):
+        return
+
+    if any(cutter.type != 'MESH' or not is_manifold(cutter.data) for cutter in cutters):
+        return
+
+    bool_mod.solver = 'FAST'
+    mesh = mesh_from_modifiers(context, target_obj, [bool_mod])
+
+    if not is_manifold(mesh) or len(mesh.polygons) == len(target_obj.data.polygons):
+        bool_mod.solver = 'EXACT'
+
+    bpy.data.meshes.remove(mesh)
+
 def bool_mod_and_apply(obj, bool_method, allow_delete = True):
     
     active_obj = bpy.context.active_object
     
     bool_mod = active_obj.modifiers.new(type="BOOLEAN", name="FC_BOOL")
-    
-    method = 'DIFFERENCE'
-    
-    if bool_method == 1:
-        method = 'UNION'
-    elif bool_method == 2:
-        method = 'INTERSECT'
-    
-    bool_mod.operation = method
+    bool_mod.operation = get_bool_operation(bool_method)
 
     if bpy.app.version >= (3, 0, 0):
         bool_mod.use_self = is_self_intersect()
@@ -84,6 +138,9 @@ def bool_mod_and_apply(obj, bool_method, allow_delete = True):
     bool_mod.object = obj
 
     recalc_normals(obj.data)
+
+    # Pending booleans don't pay for a trial evaluation
+    set_bool_solver(bpy.context, active_obj, bool_mod, is_apply_immediate())
     
     if is_apply_immediate():
         bpy.ops.object.modifier_apply(modifier=bool_mod.name)
@@ -100,14 +157,72 @@ def bool_mod_and_apply(obj, bool_method, allow_delete = True):
         if bool_method == 0 or bool_method == 2:
             obj.display_type = 'WIRE'
 
+        if is_apply_deferred():
+            enqueue_bool(active_obj, bool_mod)
+
     return False
 
 
-def execute_slice_op(context, target_obj):
+def get_world_bounds(obj):
+    # bound_box is only updated by the depsgraph, a mesh without
+    # modifiers can be measured directly, also right after it was built
+    if obj.type == 'MESH' and len(obj.modifiers) == 0 and len(obj.data.vertices) > 0:
+        corners = get_vertex_coords(obj.data).astype(np.float64)
+    else:
+        corners = np.array([corner[:] for corner in obj.bound_box])
+    mat = np.array(obj.matrix_world)
+
+    world = corners @ mat[:3, :3].T + mat[:3, 3]
+    return world.min(axis=0), world.max(axis=0)
+
+def bounds_overlap(obj_a, obj_b):
+    min_a, max_a = get_world_bounds(obj_a)
+    min_b, max_b = get_world_bounds(obj_b)
+    return bool(np.all(min_a <= max_b) and np.all(min_b <= max_a))
+
+def is_inside_object(obj, bvhtree):
+    '''True if the first vertex of the object is inside the world space bvhtree'''
+    if len(obj.data.vertices) == 0:
+        return False
+    return is_point_inside(bvhtree, obj.matrix_world @ obj.data.vertices[0].co)
+
+def is_cutter_touching(context, target_obj, cutter, prefilter = "BOUNDS"):
+    '''
+    False if the cutter can't change the target in a difference or slice
+    @prefilter : one of prefilter_items
+    Pending booleans are never skipped, the cutter can still be moved into place
+    '''
+    if prefilter == "NONE" or not is_apply_immediate():
+        return True
+
+    if not bounds_overlap(target_obj, cutter):
+        return False
+
+    if prefilter == "BVH" and target_obj.type == 'MESH' and cutter.type == 'MESH':
+        target_tree = get_target_bvhtree(context, target_obj)
+        cutter_tree = bvhtree_from_object(context, cutter)
+        if len(target_tree.overlap(cutter_tree)) > 0:
+            return True
+
+        # Without touching surfaces the cutter can still be inside the target or enclose it
+        return is_inside_object(cutter, target_tree) or is_inside_object(target_obj, cutter_tree)
+
+    return True
+
+def execute_slice_op(context, target_obj, prefilter = "BOUNDS"):
      
     # store active object
     current_obj = context.active_object
+
+    if not is_cutter_touching(context, target_obj, current_obj, prefilter):
+        return False
+
     bpy.ops.object.transform_apply(scale=True, location=False, rotation=False)
+
+    # Applied slices are cut once, pending ones need both modifiers
+    if is_apply_immediate() and can_use_exact_solver():
+        slice_and_apply(context, target_obj, current_obj)
+        return True
     
     # clone target
     select_active(target_obj)  
@@ -128,8 +243,228 @@ def execute_slice_op(context, target_obj):
     if not bool_mod_and_apply(current_obj, 0):
         select_active(current_obj)
 
+    return True
+
+def get_material_map(target_mesh, cutter):
+
+    '''
+    Target slot index for each cutter slot, like the boolean modifier transfers
+    the cutter materials. Returns the map and the materials to add to the target
+    '''
+    materials = list(target_mesh.materials)
+    new_materials = []
+    index_map = []
+
+    for slot in cutter.material_slots:
+        material = slot.material
+        if material is None:
+            index_map.append(0)
+            continue
+
+        if material not in materials:
+            materials.append(material)
+            new_materials.append(material)
+        index_map.append(materials.index(material))
+
+    return index_map, new_materials
+
+def intersect_knife(target_obj, cutter, material_map):
+
+    '''
+    Cut the target and the cutter faces along each other on a copy of the target mesh,
+    the target mesh itself is not changed. Both are split at the intersection,
+    so every island is completely inside or outside of the other mesh.
+    Returns the bmesh, with a face layer with 0 for target and 1 for cutter faces,
+    the island of every face and one point per island to classify it
+    '''
+    to_target = target_obj.matrix_world.inverted() @ cutter.matrix_world
+
+    bm = bmesh.new()
+    bm.from_mesh(target_obj.data)
+    face_count = len(bm.faces)
+    vert_count = len(bm.verts)
+
+    # Append the cutter in target space
+    bm.from_mesh(cutter.data)
+    bm.verts.ensure_lookup_table()
+    bm.faces.ensure_lookup_table()
+    bmesh.ops.transform(bm, matrix=to_target, verts=bm.verts[vert_count:])
+
+    side = bm.faces.layers.int.new("fc_slice_side")
+    for index, face in enumerate(bm.faces):
+        is_cutter = index >= face_count
+        face[side] = int(is_cutter)
+        face.select_set(is_cutter)
+
+        if is_cutter and face.material_index < len(material_map):
+            face.material_index = material_map[face.material_index]
+
+    mesh = target_obj.data
+    work_mesh = mesh.copy()
+    bm.to_mesh(work_mesh)
+    bm.free()
+
+    # Knife intersection of cutter and target
+    target_obj.data = work_mesh
+    try:
+        select_active(target_obj)
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.mesh.intersect(mode='SELECT_UNSELECT', separate_mode='ALL', solver='EXACT')
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        face_islands = get_face_islands(work_mesh)
+        island_points, island_faces = get_island_points(work_mesh, face_islands)
+
+        bm = bmesh.new()
+        bm.from_mesh(work_mesh)
+    finally:
+        if target_obj.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        target_obj.data = mesh
+        bpy.data.meshes.remove(work_mesh)
+
+    return bm, face_islands, island_points, island_faces
+
+def weld_seam(bm, side, dist=0.0001):
+
+    '''
+    Close the seams between target and cutter faces. Only open target
+    vertices are merged into open cutter vertices.
+    '''
+    cutter_verts = set()
+    target_verts = set()
+    for edge in bm.edges:
+        if edge.is_boundary:
+            verts = cutter_verts if edge.link_faces[0][side] == 1 else target_verts
+            verts.update(edge.verts)
+
+    if not cutter_verts or not target_verts:
+        return
+
+    cutter_verts = list(cutter_verts)
+    kd = KDTree(len(cutter_verts))
+    for index, vert in enumerate(cutter_verts):
+        kd.insert(vert.co, index)
+    kd.balance()
+
+    targetmap = {}
+    for vert in target_verts:
+        co, index, distance = kd.find(vert.co)
+        if co is not None and distance <= dist:
+            targetmap[vert] = cutter_verts[index]
+
+    if targetmap:
+        bmesh.ops.weld_verts(bm, targetmap=targetmap)
+
+def split_slice(bm, keep_mask, flip_mask):
+
+    '''Copy of the bmesh with only the faces of keep_mask, the faces of flip_mask reversed'''
+
+    bm = bm.copy()
+    faces = list(bm.faces)
+
+    flip = [f for f, is_flipped in zip(faces, flip_mask.tolist()) if is_flipped]
+    bmesh.ops.reverse_faces(bm, faces=flip)
+    bmesh.ops.delete(bm, geom=[f for f, is_kept in zip(faces, keep_mask.tolist()) if not is_kept], context='FACES')
+
+    side = bm.faces.layers.int.get("fc_slice_side")
+    weld_seam(bm, side)
+
+    bm.faces.layers.int.remove(side)
+    return bm
+
+def slice_and_apply(context, target_obj, cutter):
+
+    '''
+    Slice the target with one knife intersection instead of two booleans.
+    The islands between the cuts are classified as inside or outside of the other mesh,
+    the target keeps the outside part and the inside part is a new object.
+    '''
+
+    if target_obj.data.users > 1:
+        target_obj.data = target_obj.data.copy()
+
+    recalc_normals(cutter.data)
+
+    # Inside tests against the uncut surfaces
+    to_target = target_obj.matrix_world.inverted() @ cutter.matrix_world
+    cutter_bm = bmesh.new()
+    cutter_bm.from_mesh(cutter.data)
+    cutter_bm.transform(to_target)
+    cutter_tree = BVHTree.FromBMesh(cutter_bm)
+    cutter_bm.free()
+
+    target_bm = bmesh.new()
+    target_bm.from_mesh(target_obj.data)
+    target_tree = BVHTree.FromBMesh(target_bm)
+    target_bm.free()
+
+    material_map, new_materials = get_material_map(target_obj.data, cutter)
+
+    bm, face_islands, island_points, island_faces = intersect_knife(target_obj, cutter, material_map)
+
+    # One side lookup and one inside test per island
+    side = bm.faces.layers.int.get("fc_slice_side")
+    bm.faces.ensure_lookup_table()
+    island_cutter = np.array([bm.faces[i][side] == 1 for i in island_faces.tolist()], dtype=bool)
+
+    # Target islands are tested against the cutter, cutter islands against the target
+    island_inside = np.array([is_point_inside(target_tree if is_cutter else cutter_tree, point)
+                              for is_cutter, point in zip(island_cutter.tolist(), island_points.tolist())], dtype=bool)
+
+    is_cutter = island_cutter[face_islands]
+    is_inside = island_inside[face_islands]
+
+    cutter_inside = is_cutter & is_inside
+    bm_outside = split_slice(bm, (~is_cutter & ~is_inside) | cutter_inside, cutter_inside)
+    bm_inside = split_slice(bm, (~is_cutter & is_inside) | cutter_inside, np.zeros(len(is_cutter), dtype=bool))
+    bm.free()
+
+    # Slots for the cutter materials, before the slice copies the mesh
+    for material in new_materials:
+        target_obj.data.materials.append(material)
+
+    # The inside part is a copy of the target with its own mesh
+    slice_obj = target_obj.copy()
+    slice_obj.data = target_obj.data.copy()
+    for collection in target_obj.users_collection:
+        collection.objects.link(slice_obj)
+
+    bm_outside.to_mesh(target_obj.data)
+    bm_inside.to_mesh(slice_obj.data)
+    bm_outside.free()
+    bm_inside.free()
+
+    for obj in (target_obj, slice_obj):
+        obj.data.update()
+        if has_bevel_mod(obj):
+            set_smooth(obj.data)
+
+    if is_delete_after_apply():
+        bpy.data.objects.remove(cutter, do_unlink=True)
+        select_active(target_obj)
+    else:
+        select_active(cutter)
+
+    return slice_obj
+
 def union_selected(context):
     active_obj = bpy.context.active_object
+
+    if can_use_collection_operand():
+        operands = [obj for obj in context.selected_objects if obj is not active_obj]
+        if not operands:
+            return
+
+        # One union for all operands, then remove them at once
+        collection_bool_and_apply(active_obj, operands, 1)
+
+        for obj in operands:
+            bpy.data.objects.remove(obj, do_unlink=True)
+
+        select_active(active_obj)
+        return
+
     for obj in context.selected_objects:
         if obj is not active_obj:          
             bool_mod = active_obj.modifiers.new(type="BOOLEAN", name="FC_BOOL")
@@ -146,20 +481,141 @@ def union_selected(context):
             select_active(active_obj)
     
     
-def execute_boolean_op(context, target_obj, bool_method = 0):
+def execute_boolean_op(context, target_obj, bool_method = 0, prefilter = "BOUNDS"):
     
     '''
     function for bool operation
     @target_obj : target object of the bool operation
     @bool_method : 0 = difference, 1 = union, 2 = intersect  
+    @prefilter : skip a difference with a cutter not touching the target
+    Returns False if the cutter was skipped
     '''
 
     # store active object
     current_obj = context.object
+
+    # Union and intersect change the target even without overlap
+    if bool_method == 0 and not is_cutter_touching(context, target_obj, current_obj, prefilter):
+        return False
+
     bpy.ops.object.transform_apply(scale=True, location=False, rotation=False)
     
     # make target the active object
     select_active(target_obj)
         
     if not bool_mod_and_apply(current_obj, bool_method):
-        select_active(current_obj)
\ No newline at end of file
+        select_active(current_obj)
+
+    return True
+
+def get_cutters(context, target_obj):
+    return [obj for obj in context.selected_objects if obj is not target_obj]
+
+def can_use_collection_operand():
+    return bpy.app.version >= (2, 91, 0)
+
+def can_use_exact_solver():
+    return bpy.app.version >= (2, 91, 0)
+
+def group_cutters(target_obj, cutter_ops):
+    # Keep the order in which the operations appear first
+    groups = {}
+    for cutter, bool_method in cutter_ops:
+        if cutter is not target_obj:
+            groups.setdefault(bool_method, []).append(cutter)
+    return groups
+
+def collection_bool_and_apply(target_obj, cutters, bool_method):
+
+    # Temporary collection as operand, not linked to the scene
+    bool_coll = bpy.data.collections.new("FC_BOOL_Batch")
+    for cutter in cutters:
+        bool_coll.objects.link(cutter)
+        recalc_normals(cutter.data)
+
+    select_active(target_obj)
+
+    bool_mod = target_obj.modifiers.new(type="BOOLEAN", name="FC_BOOL")
+    bool_mod.operation = get_bool_operation(bool_method)
+    bool_mod.operand_type = 'COLLECTION'
+    bool_mod.collection = bool_coll
+
+    if bpy.app.version >= (3, 0, 0):
+        bool_mod.use_self = is_self_intersect()
+        bool_mod.use_hole_tolerant = is_hole_tolerant()
+
+    # A fast result that did not change the target falls back to exact in AUTO mode
+    set_bool_solver(bpy.context, target_obj, bool_mod)
+
+    bpy.ops.object.modifier_apply(modifier=bool_mod.name)
+    bpy.data.collections.remove(bool_coll)
+
+def execute_boolean_batch(context, target_obj, cutter_ops, prefilter = "BOUNDS"):
+
+    '''
+    bool operation of many cutters against one target
+    @target_obj : target object of the bool operations
+    @cutter_ops : list of (cutter, bool_method) pairs, see execute_boolean_op
+    The cutters are grouped by operation and each group is applied
+    as one collection boolean, so the target is evaluated once per operation.
+    Returns the skipped cutters
+    '''
+
+    groups = group_cutters(target_obj, cutter_ops)
+
+    skipped = []
+    if 0 in groups:
+        skipped = [c for c in groups[0] if not is_cutter_touching(context, target_obj, c, prefilter)]
+        groups[0] = [c for c in groups[0] if c not in skipped]
+        if not groups[0]:
+            del groups[0]
+
+    if not groups:
+        return skipped
+
+    cutters = [cutter for group in groups.values() for cutter in group]
+
+    # Apply the scale of all cutters at once
+    bpy.ops.object.select_all(action='DESELECT')
+    for cutter in cutters:
+        cutter.select_set(state=True)
+    bpy.context.view_layer.objects.active = cutters[0]
+    bpy.ops.object.transform_apply(scale=True, location=False, rotation=False)
+
+    # Pending booleans stay one modifier per cutter
+    if not is_apply_immediate() or not can_use_collection_operand():
+        select_active(target_obj)
+        for bool_method, group in groups.items():
+            for cutter in group:
+                bool_mod_and_apply(cutter, bool_method)
+                select_active(target_obj)
+        return skipped
+
+    for bool_method, group in groups.items():
+        collection_bool_and_apply(target_obj, group, bool_method)
+
+    if has_bevel_mod(target_obj):
+        bpy.ops.object.shade_smooth()
+
+    if is_delete_after_apply():
+        bpy.ops.object.select_all(action='DESELECT')
+        for cutter in cutters:
+            cutter.select_set(state=True)
+        bpy.ops.object.delete()
+
+    select_active(target_obj)
+    return skipped
+
+def execute_boolean_selected(context, target_obj, bool_method = 0, prefilter = "BOUNDS"):
+
+    '''Returns the number of skipped cutters'''
+
+    # Several selected cutters are applied as one batch
+    cutters = get_cutters(context, target_obj)
+    if len(cutters) > 1:
+        cutter_ops = [(cutter, bool_method) for cutter in cutters]
+        return len(execute_boolean_batch(context, target_obj, cutter_ops, prefilter))
+
+    if not execute_boolean_op(context, target_obj, bool_method, prefilter):
+        return 1
+    return 0
@@ -0,0 +1,81 @@
+import bpy
+
+from bpy.app.handlers import persistent
+
+from . fc_view_3d_utils import bvhtree_from_object, get_raycast_param
+
+# BVH tree of the carver target in world space, see get_target_bvhtree
+_bvh_cache = {
+    "key": None,
+    "bvhtree": None
+}
+
+def get_bvh_key(obj):
+    matrix = tuple(tuple(row) for row in obj.matrix_world)
+    return (obj.as_pointer(), obj.data.as_pointer(), matrix)
+
+def clear_bvh_cache():
+    _bvh_cache["key"] = None
+    _bvh_cache["bvhtree"] = None
+
+def get_target_bvhtree(context, obj):
+    key = get_bvh_key(obj)
+
+    if _bvh_cache["key"] != key:
+        _bvh_cache["bvhtree"] = bvhtree_from_object(context, obj)
+        _bvh_cache["key"] = key
+
+    return _bvh_cache["bvhtree"]
+
+def can_use_target_bvh(obj):
+    return obj is not None and obj.type == 'MESH' and obj.visible_get()
+
+def ray_cast_target(context, origin, direction):
+    '''
+    Raycast against the carver target if there is one, else or if the target
+    is missed against the scene.
+    Returns hit, location, normal, face index and object like scene.ray_cast
+    '''
+    target = context.scene.carver_target
+
+    if can_use_target_bvh(target):
+        bvhtree = get_target_bvhtree(context, target)
+        location, normal, face, distance = bvhtree.ray_cast(origin, direction)
+
+        if location is not None:
+            return True, location, normal, face, target
+
+    ray_cast_param = get_raycast_param(context.view_layer)
+    hit, location, normal, face, hit_obj, *_ = context.scene.ray_cast(ray_cast_param, origin, direction)
+    return hit, location, normal, face, hit_obj
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    key = _bvh_cache["key"]
+    if key is None:
+        return
+
+    # Drop the tree when the target geometry or transform changed
+    for update in depsgraph.updates:
+        id_ptr = update.id.original.as_pointer()
+        if id_ptr == key[0] or id_ptr == key[1]:
+            if update.is_updated_geometry or update.is_updated_transform:
+                clear_bvh_cache()
+                return
+
+@persistent
+def on_load_post(dummy):
+    clear_bvh_cache()
+
+def register_bvh_handlers():
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+    bpy.app.handlers.load_post.append(on_load_post)
+
+def unregister_bvh_handlers():
+    if on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+
+    if on_load_post in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(on_load_post)
+
+    clear_bvh_cache()
@@ -0,0 +1,72 @@
+import bpy
+import numpy as np
+
+def to_coords(points):
+    return np.array([tuple(p)[:3] for p in points], dtype=np.float32).reshape(-1, 3)
+
+def new_curve_object(context, name):
+    '''Curve object with an empty 3D curve, linked like the primitive operators do'''
+    curve = bpy.data.curves.new(name, type='CURVE')
+    curve.dimensions = '3D'
+
+    obj = bpy.data.objects.new(name, curve)
+    context.collection.objects.link(obj)
+
+    for selected in context.selected_objects:
+        selected.select_set(False)
+
+    obj.select_set(True)
+    context.view_layer.objects.active = obj
+
+    return obj
+
+def add_poly_spline(curve, points, location=(0, 0, 0)):
+    '''Poly spline through the world positions, relative to the object location'''
+    coords = to_coords(points) - np.asarray(location, dtype=np.float32)
+    if len(coords) == 0:
+        return None
+
+    spline = curve.splines.new('POLY')
+
+    # A new spline already has one point
+    spline.points.add(len(coords) - 1)
+
+    # Points are (x, y, z, w)
+    co = np.ones((len(coords), 4), dtype=np.float32)
+    co[:, :3] = coords
+    spline.points.foreach_set("co", co.ravel())
+
+    return spline
+
+def add_bezier_spline(curve, points, handles_left=None, handles_right=None):
+    '''
+    Bezier spline through the world positions. Points without handles,
+    given as None, get automatic handles.
+    '''
+    coords = to_coords(points)
+    count = len(coords)
+    if count == 0:
+        return None
+
+    handles_left = handles_left or [None] * count
+    handles_right = handles_right or [None] * count
+
+    spline = curve.splines.new('BEZIER')
+    spline.bezier_points.add(count - 1)
+
+    bez_points = spline.bezier_points
+
+    # Types first, setting the type can move the handles
+    for bez_point, left, right in zip(bez_points, handles_left, handles_right):
+        handle_type = 'AUTO' if left is None or right is None else 'ALIGNED'
+        bez_point.handle_left_type = handle_type
+        bez_point.handle_right_type = handle_type
+
+    bez_points.foreach_set("co", coords.ravel())
+
+    for bez_point, left, right in zip(bez_points, handles_left, handles_right):
+        if left is not None and right is not None:
+            bez_point.handle_left = left
+            bez_point.handle_right = right
+
+    return spline
@@ -1,5 +1,7 @@
 import gpu
 
+from gpu_extras.batch import batch_for_shader
+
 from .. utils.shader_utils import *
 
 def set_line_smooth(enabled=True):
@@ -14,35 +16,57 @@ def set_poly_smooth(enabled=True):
     else:
         gpu.state.blend_set('NONE')
 
-def draw_circle_2d(position, color, radius, segments=32, batch_type='TRI_FAN'):
+# Batches in local coordinates, built once and drawn with a translation
+_batch_cache = {}
+
+def get_cached_batch(key, shader, type, content, indices=None):
+    batch = _batch_cache.get(key)
+    if batch is None:
+        batch = batch_for_shader(shader, type, content, indices=indices)
+        _batch_cache[key] = batch
+    return batch
+
+def draw_cached_batch(batch, shader, color, position):
+    shader.bind()
+    shader.uniform_float("color", color)
+
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate(position)
+        batch.draw(shader)
+
+def get_circle_batch(shader, segments, batch_type):
+    key = ("circle", segments, batch_type)
+    batch = _batch_cache.get(key)
+    if batch is None:
 
-    from math import sin, cos, pi
-    import gpu
-    from gpu.types import (
-        GPUBatch,
-        GPUVertBuf,
-        GPUVertFormat,
-    )
+        from math import sin, cos, pi
+
+        mul = (1.0 / (segments - 1)) * (pi * 2)
+        verts = [(sin(i * mul), cos(i * mul)) for i in range(segments)]
+        batch = batch_for_shader(shader, batch_type, {"pos": verts})
+        _batch_cache[key] = batch
+
+    return batch
+
+def clear_batch_cache():
+    _batch_cache.clear()
+
+def draw_circle_2d(position, color, radius, segments=32, batch_type='TRI_FAN'):
 
     if segments <= 0:
         raise ValueError("Amount of segments must be greater than 0.")
 
     set_line_smooth()
     gpu.state.depth_mask_set(False)
-    
+
+    shader = get_builtin_shader('UNIFORM_COLOR', '2D')
+    batch = get_circle_batch(shader, segments, batch_type)
+
     with gpu.matrix.push_pop():
         gpu.matrix.translate(position)
         gpu.matrix.scale_uniform(radius)
-        mul = (1.0 / (segments - 1)) * (pi * 2)
-        verts = [(sin(i * mul), cos(i * mul)) for i in range(segments)]
-        fmt = GPUVertFormat()
-        pos_id = fmt.attr_add(id="pos", comp_type='F32', len=2, fetch_mode='FLOAT')
-        vbo = GPUVertBuf(len=len(verts), format=fmt)
-        vbo.attr_fill(id=pos_id, data=verts)
-        batch = GPUBatch(type=batch_type, buf=vbo)
-        shader = get_builtin_shader('UNIFORM_COLOR', '2D')
-        batch.program_set(shader)
+        shader.bind()
         shader.uniform_float("color", color)
-        batch.draw()
+        batch.draw(shader)
 
-    set_line_smooth(False)
\ No newline at end of file
+    set_line_smooth(False)
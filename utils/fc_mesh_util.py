@@ -0,0 +1,439 @@
+import bpy
+import bmesh
+import zlib
+import numpy as np
+
+from mathutils import Matrix, Vector
+from mathutils.kdtree import KDTree
+
+# Custom mesh property with the topology key of a mesh known to be
+# closed with outward normals, see stamp_winding
+WINDING_STAMP = "fc_winding"
+
+def get_loop_normal(verts):
+    '''Newell normal of a closed vertex loop given as (N, 3) array'''
+    nxt = np.roll(verts, -1, axis=0)
+    return np.cross(verts, nxt).sum(axis=0)
+
+def get_loop_geometry(verts, extrude_dir=None):
+    '''
+    Returns vertices and faces for one vertex loop, either as a single face
+    or as a closed prism when extrude_dir is given.
+    Faces are oriented outwards so no normal recalculation is needed.
+    '''
+    verts = np.asarray(verts, dtype=np.float64).reshape(-1, 3)
+    count = len(verts)
+
+    if extrude_dir is None:
+        return verts, [list(range(count))]
+
+    extrude_dir = np.asarray(extrude_dir, dtype=np.float64)
+
+    # Make the loop counter clockwise when looking against the extrusion
+    if np.dot(get_loop_normal(verts), extrude_dir) < 0:
+        verts = verts[::-1]
+
+    idx = np.arange(count)
+    nxt = np.roll(idx, -1)
+
+    sides = np.column_stack((idx, nxt, nxt + count, idx + count))
+
+    faces = [list(range(count - 1, -1, -1)), list(range(count, 2 * count))]
+    faces.extend(sides.tolist())
+
+    return np.vstack((verts, verts + extrude_dir)), faces
+
+def build_loop_mesh(mesh, loops, extrude_dir=None):
+    '''Fill the mesh with all vertex loops in one from_pydata call'''
+    all_verts = []
+    all_faces = []
+    offset = 0
+
+    for loop in loops:
+        if len(loop) < 3:
+            continue
+
+        verts, faces = get_loop_geometry(loop, extrude_dir)
+
+        all_verts.append(verts)
+        all_faces.extend([[i + offset for i in face] for face in faces])
+        offset += len(verts)
+
+    if not all_verts:
+        return
+
+    mesh.from_pydata(np.vstack(all_verts).tolist(), [], all_faces)
+    mesh.update()
+
+def get_vertex_coords(mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+def find_doubles(coords, dist):
+    '''
+    Returns a dict that maps each double vertex index to the index
+    of the first vertex within dist, like remove_doubles merges them
+    '''
+    kd = KDTree(len(coords))
+    for i, co in enumerate(coords.tolist()):
+        kd.insert(co, i)
+    kd.balance()
+
+    targetmap = {}
+    for i, co in enumerate(coords.tolist()):
+        if i in targetmap:
+            continue
+
+        for _, j, _ in kd.find_range(co, dist):
+            if j > i and j not in targetmap:
+                targetmap[j] = i
+
+    return targetmap
+
+def weld_vertices(mesh, dist=0.0001):
+    '''
+    Merge vertices closer than dist in object mode.
+    The mesh is only rebuilt when there is something to merge.
+    '''
+    targetmap = find_doubles(get_vertex_coords(mesh), dist)
+    if not targetmap:
+        return 0
+
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    bm.verts.ensure_lookup_table()
+
+    bmesh.ops.weld_verts(bm, targetmap={bm.verts[j]: bm.verts[i] for j, i in targetmap.items()})
+
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+    return len(targetmap)
+
+def get_directed_edges(mesh):
+    '''Start and end vertex of every face loop, following the face winding'''
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", starts)
+    mesh.polygons.foreach_get("loop_total", totals)
+
+    # Next loop of the same face, the last loop wraps to the first
+    next_loop = np.arange(len(loop_verts)) + 1
+    next_loop[starts + totals - 1] = starts
+
+    return loop_verts, loop_verts[next_loop]
+
+def get_boundary_edges(mesh):
+    '''
+    Edges used by one face in face winding order, and wire edges.
+    Returns an (N, 2) vertex index array and a mask of the oriented edges.
+    '''
+    count = np.int64(len(mesh.vertices))
+
+    v_from, v_to = get_directed_edges(mesh)
+    keys = np.minimum(v_from, v_to).astype(np.int64) * count + np.maximum(v_from, v_to)
+    unique_keys, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+
+    boundary = counts[inverse] == 1
+    boundary_edges = np.column_stack((v_from[boundary], v_to[boundary]))
+
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    edges = edges.reshape(-1, 2)
+
+    edge_keys = edges.min(axis=1).astype(np.int64) * count + edges.max(axis=1)
+    wire_edges = edges[~np.isin(edge_keys, unique_keys)]
+
+    oriented = np.zeros(len(boundary_edges) + len(wire_edges), dtype=bool)
+    oriented[:len(boundary_edges)] = True
+
+    return np.concatenate((boundary_edges, wire_edges)).astype(np.int32), oriented
+
+def get_boundary_loops(mesh):
+    '''
+    All chains of boundary and wire edges as lists of vertex indices.
+    Closed loops don't repeat the first vertex, boundary loops follow
+    the winding of their faces.
+    '''
+    edges, oriented = get_boundary_edges(mesh)
+    if len(edges) == 0:
+        return []
+
+    # Edges at each vertex, vertex v uses edge_at[offsets[v]:offsets[v + 1]]
+    ends = edges.ravel()
+    order = np.argsort(ends, kind='stable')
+    edge_at = (order // 2).tolist()
+    offsets = np.searchsorted(ends[order], np.arange(len(mesh.vertices) + 1)).tolist()
+
+    edge_list = edges.tolist()
+    oriented = oriented.tolist()
+    used = [False] * len(edge_list)
+
+    # Next edge to look at per vertex, so every edge is only checked twice
+    cursor = offsets[:-1]
+
+    def walk(start):
+        loop = [start]
+        winding = 0
+        v = start
+
+        while True:
+            edge = None
+            while cursor[v] < offsets[v + 1]:
+                candidate = edge_at[cursor[v]]
+                cursor[v] += 1
+                if not used[candidate]:
+                    edge = candidate
+                    break
+
+            if edge is None:
+                break
+
+            used[edge] = True
+            a, b = edge_list[edge]
+            next_v = b if v == a else a
+
+            if oriented[edge]:
+                winding += 1 if v == a else -1
+
+            if next_v == start:
+                break
+
+            loop.append(next_v)
+            v = next_v
+
+        if winding < 0:
+            loop.reverse()
+        return loop
+
+    loops = []
+
+    # Open chains have to start at one of their ends
+    degrees = np.diff(offsets)
+    for start in np.flatnonzero(degrees % 2 == 1).tolist():
+        if cursor[start] < offsets[start + 1]:
+            loop = walk(start)
+            if len(loop) > 1:
+                loops.append(loop)
+
+    for edge in range(len(edge_list)):
+        if not used[edge]:
+            loop = walk(edge_list[edge][0])
+            if len(loop) > 1:
+                loops.append(loop)
+
+    return loops
+
+def is_winding_consistent(mesh):
+    '''True if the mesh is closed and all faces have the same winding'''
+    if len(mesh.polygons) == 0:
+        return False
+
+    v_from, v_to = get_directed_edges(mesh)
+
+    count = np.int64(len(mesh.vertices))
+    edges = v_from.astype(np.int64) * count + v_to
+    reverse = v_to.astype(np.int64) * count + v_from
+
+    # A flipped neighbour uses the shared edge in the same direction
+    if len(np.unique(edges)) != len(edges):
+        return False
+
+    # Every edge has to be used in both directions
+    return bool(np.all(np.isin(reverse, edges)))
+
+def get_vertex_islands(mesh):
+    '''Island label per vertex, the lowest vertex index of its connected part'''
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    edges = edges.reshape(-1, 2)
+
+    labels = np.arange(len(mesh.vertices))
+    while True:
+        # Hook the labels of both ends to the lower one, then shortcut the chains
+        a = labels[edges[:, 0]]
+        b = labels[edges[:, 1]]
+        low = np.minimum(a, b)
+
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, a, low)
+        np.minimum.at(new_labels, b, low)
+        np.minimum.at(new_labels, edges[:, 0], low)
+        np.minimum.at(new_labels, edges[:, 1], low)
+        new_labels = new_labels[new_labels]
+
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+def get_face_islands(mesh):
+    '''Island index of every face, numbered from 0'''
+    starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", starts)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    _, face_islands = np.unique(get_vertex_islands(mesh)[loop_verts[starts]], return_inverse=True)
+    return face_islands
+
+def get_island_points(mesh, face_islands):
+    '''
+    Returns the center of the largest face of each island as (N, 3) array,
+    it is away from the island border, and the index of that face
+    '''
+    centers = np.empty(len(mesh.polygons) * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("center", centers)
+    areas = np.empty(len(mesh.polygons), dtype=np.float32)
+    mesh.polygons.foreach_get("area", areas)
+
+    # Largest face first within each island
+    order = np.lexsort((-areas, face_islands))
+    _, first = np.unique(face_islands[order], return_index=True)
+    return centers.reshape(-1, 3)[order[first]], order[first]
+
+def get_signed_volumes(mesh, face_islands):
+    '''Signed volume per island, face_islands is the island index of every face'''
+    mesh.calc_loop_triangles()
+
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    tri_faces = np.empty(len(mesh.loop_triangles), dtype=np.int32)
+    mesh.loop_triangles.foreach_get("polygon_index", tri_faces)
+
+    tri_co = get_vertex_coords(mesh).astype(np.float64)[tris.reshape(-1, 3)]
+    volumes = np.einsum('ij,ij->i', tri_co[:, 0], np.cross(tri_co[:, 1], tri_co[:, 2])) / 6.0
+    return np.bincount(face_islands[tri_faces], weights=volumes, minlength=face_islands.max() + 1)
+
+def get_topology_key(mesh):
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    # Any change of the faces or their winding changes the key, moved
+    # vertices too since they can turn an island inside out
+    crc = zlib.crc32(loop_verts.tobytes())
+    crc = zlib.crc32(get_vertex_coords(mesh).tobytes(), crc)
+    return "%d:%d:%08x" % (len(mesh.vertices), len(mesh.polygons), crc)
+
+def stamp_winding(mesh):
+    mesh[WINDING_STAMP] = get_topology_key(mesh)
+
+def has_winding_stamp(mesh):
+    stamp = mesh.get(WINDING_STAMP)
+    return stamp is not None and stamp == get_topology_key(mesh)
+
+def orient_normals_outward(mesh):
+    '''
+    Point the normals of every closed island outwards. Stamped meshes are skipped.
+    When the winding is consistent only the sign of the volume of each island
+    is checked and inverted islands are flipped, otherwise a bmesh
+    recalculation is done.
+    '''
+    if has_winding_stamp(mesh):
+        return
+
+    if not is_winding_consistent(mesh):
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+        return
+
+    face_islands = get_face_islands(mesh)
+    inverted = get_signed_volumes(mesh, face_islands) < 0
+
+    if np.all(inverted) and hasattr(mesh, "flip_normals"):
+        mesh.flip_normals()
+        mesh.update()
+    elif np.any(inverted):
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bm.faces.ensure_lookup_table()
+        flip = np.flatnonzero(inverted[face_islands]).tolist()
+        bmesh.ops.reverse_faces(bm, faces=[bm.faces[i] for i in flip])
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+
+    stamp_winding(mesh)
+
+# Ray directions for the inside test, not aligned with the axes
+# so rays rarely run along edges of axis aligned meshes
+INSIDE_TEST_DIRECTIONS = (Vector((0.5327, 0.6108, 0.5858)).normalized(),
+                          Vector((-0.7194, 0.2611, -0.6437)).normalized(),
+                          Vector((0.1903, -0.8865, 0.4218)).normalized())
+
+def count_ray_hits(bvhtree, origin, direction, max_hits=1000):
+    hits = 0
+    while hits < max_hits:
+        location, _, _, _ = bvhtree.ray_cast(origin, direction)
+        if location is None:
+            break
+
+        hits += 1
+        origin = location + direction * 0.00001
+
+    return hits
+
+def is_point_inside(bvhtree, point):
+    '''
+    Inside test against the closed surface of the bvhtree.
+    A ray from inside crosses the surface an odd number of times,
+    the majority of a few directions decides.
+    '''
+    point = Vector(point)
+    inside = sum(count_ray_hits(bvhtree, point, direction) % 2 for direction in INSIDE_TEST_DIRECTIONS)
+    return inside * 2 > len(INSIDE_TEST_DIRECTIONS)
+
+def set_smooth(mesh, smooth=True):
+    mesh.polygons.foreach_set("use_smooth", [smooth] * len(mesh.polygons))
+    mesh.update()
+
+def is_manifold(mesh):
+    '''True if every edge is used by exactly two faces'''
+    if len(mesh.polygons) == 0:
+        return False
+
+    edge_index = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", edge_index)
+
+    face_count = np.bincount(edge_index, minlength=len(mesh.edges))
+    return bool(np.all(face_count == 2))
+
+def mesh_from_modifiers(context, obj, modifiers):
+    '''
+    New mesh of the object with only the given modifiers evaluated, to inspect
+    their result. It has all data layers of the object, but is not linked to it.
+    '''
+    others = [m for m in obj.modifiers if m not in modifiers and m.show_viewport]
+    for modifier in others:
+        modifier.show_viewport = False
+
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph),
+                                               preserve_all_data_layers=True, depsgraph=depsgraph)
+    finally:
+        for modifier in others:
+            modifier.show_viewport = True
+
+    return mesh
+
+def set_origin_to_geometry(obj):
+    '''Same as origin_set(type='ORIGIN_GEOMETRY') with median center, in object mode'''
+    mesh = obj.data
+    if len(mesh.vertices) == 0:
+        return
+
+    median = Vector(get_vertex_coords(mesh).mean(axis=0).tolist())
+
+    mesh.transform(Matrix.Translation(-median))
+    mesh.update()
+
+    obj.matrix_world = obj.matrix_world @ Matrix.Translation(median)
@@ -0,0 +1,30 @@
+import bpy
+
+# Events that don't change anything drawn by themselves
+PASSIVE_EVENTS = {'MOUSEMOVE', 'INBETWEEN_MOUSEMOVE', 'TIMER', 'TIMER_REPORT', 'NONE'}
+
+# Areas whose drawn state changed, see tag_redraw_if_requested.
+# Each modal only clears the request of its own area.
+_redraw_areas = set()
+
+def get_area_key(context):
+    area = context.area if context is not None else None
+    return area.as_pointer() if area is not None else None
+
+def request_redraw(context):
+    key = get_area_key(context)
+    if key is not None:
+        _redraw_areas.add(key)
+
+def request_redraw_for_event(context, event):
+    '''Clicks and key presses may change anything, mouse moves have to request a redraw'''
+    if event.type not in PASSIVE_EVENTS:
+        request_redraw(context)
+
+def tag_redraw_if_requested(context):
+    key = get_area_key(context)
+    if key not in _redraw_areas:
+        return
+
+    _redraw_areas.discard(key)
+    context.area.tag_redraw()
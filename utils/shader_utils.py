@@ -1,8 +1,15 @@
 import bpy
 import gpu
 
+# Builtin shaders by name, shared by all widgets and shapes
+_shader_cache = {}
+
 def get_builtin_shader(shader, pre):
-  if bpy.app.version >= (4, 0, 0):
-    return gpu.shader.from_builtin(shader)
-  else:
-    return gpu.shader.from_builtin(pre + '_' + shader)
\ No newline at end of file
+  key = (shader, pre)
+  if key not in _shader_cache:
+    if bpy.app.version >= (4, 0, 0):
+      _shader_cache[key] = gpu.shader.from_builtin(shader)
+    else:
+      _shader_cache[key] = gpu.shader.from_builtin(pre + '_' + shader)
+
+  return _shader_cache[key]
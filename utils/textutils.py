@@ -5,4 +5,22 @@ def blf_set_size(fontid, size):
     if bpy.app.version >= (4, 0, 0):
         blf.size(fontid, size)
     else:
-        blf.size(fontid, size, 72)
\ No newline at end of file
+        blf.size(fontid, size, 72)
+
+# Measured text per font and size, texts are mostly redrawn unchanged
+_dimensions_cache = {}
+
+def get_text_dimensions(fontid, size, text):
+    key = (fontid, size, text)
+    dimensions = _dimensions_cache.get(key)
+    if dimensions is None:
+
+        # Typed text would grow the cache forever
+        if len(_dimensions_cache) > 1024:
+            _dimensions_cache.clear()
+
+        blf_set_size(fontid, size)
+        dimensions = blf.dimensions(fontid, text)
+        _dimensions_cache[key] = dimensions
+
+    return dimensions
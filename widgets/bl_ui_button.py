@@ -23,6 +23,7 @@ class BL_UI_Button(BL_UI_Widget):
         self.__image = None
         self.__image_size = (24, 24)
         self.__image_position = (4, 2)
+        self.__image_key = None
 
     @property
     def text_color(self):
@@ -31,6 +32,7 @@ class BL_UI_Button(BL_UI_Widget):
     @text_color.setter
     def text_color(self, value):
         self._text_color = value
+        self.request_redraw()
 
     @property
     def text(self):
@@ -39,6 +41,7 @@ class BL_UI_Button(BL_UI_Widget):
     @text.setter
     def text(self, value):
         self._text = value
+        self.request_redraw()
                 
     @property
     def text_size(self):
@@ -47,6 +50,7 @@ class BL_UI_Button(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self.request_redraw()
 
     @property
     def hover_bg_color(self):
@@ -55,6 +59,7 @@ class BL_UI_Button(BL_UI_Widget):
     @hover_bg_color.setter
     def hover_bg_color(self, value):
         self._hover_bg_color = value
+        self.request_redraw()
 
     @property
     def select_bg_color(self):
@@ -63,6 +68,7 @@ class BL_UI_Button(BL_UI_Widget):
     @select_bg_color.setter
     def select_bg_color(self, value):
         self._select_bg_color = value 
+        self.request_redraw()
 
     def set_text_offset(self, x,y):
         self._textoffset = [x,y]
@@ -96,7 +102,7 @@ class BL_UI_Button(BL_UI_Widget):
         
         gpu.state.blend_set('ALPHA')
 
-        self.batch_panel.draw(self.shader) 
+        self.draw_batch(self.batch_panel)
 
         self.draw_image()   
 
@@ -121,7 +127,7 @@ class BL_UI_Button(BL_UI_Widget):
 
     def draw_text(self, area_height):
         blf_set_size(0, self._text_size)
-        size = blf.dimensions(0, self._text)
+        size = get_text_dimensions(0, self._text_size, self._text)
 
         textpos_y = area_height - self._textpos[1] - (self.height + size[1]) / 2.0
         textpos_y += self._textoffset[1]
@@ -136,36 +142,43 @@ class BL_UI_Button(BL_UI_Widget):
     def draw_image(self):
         if self.__image is not None:
             try:
-                y_screen_flip = self.get_area_height() - self.y_screen
-        
-                off_x, off_y =  self.__image_position
-                sx, sy = self.__image_size
-                
-                # bottom left, top left, top right, bottom right
-                vertices = (
-                            (self.x_screen + off_x, y_screen_flip - off_y), 
-                            (self.x_screen + off_x, y_screen_flip - sy - off_y), 
-                            (self.x_screen + off_x + sx, y_screen_flip - sy - off_y),
-                            (self.x_screen + off_x + sx, y_screen_flip - off_y))
-                
-                self.shader_img = get_builtin_shader('IMAGE', '2D')
-                self.batch_img = batch_for_shader(self.shader_img, 'TRI_FAN', 
-                { "pos" : vertices, 
-                "texCoord": ((0, 1), (0, 0), (1, 0), (1, 1)) 
-                },)
+                self.update_image_batch()
 
                 texture = gpu.texture.from_image(self.__image)
 
                 self.shader_img.bind()
                 self.shader.uniform_sampler("image", texture)
 
-                self.batch_img.draw(self.shader_img) 
+                self.draw_batch(self.batch_img, shader=self.shader_img)
                 return True
             except:
                 pass
 
         return False     
         
+    def update_image_batch(self):
+        image_key = (self.__image_size, self.__image_position)
+        if image_key == self.__image_key:
+            return
+
+        self.__image_key = image_key
+
+        off_x, off_y =  self.__image_position
+        sx, sy = self.__image_size
+        
+        # bottom left, top left, top right, bottom right
+        vertices = (
+                    (off_x, -off_y), 
+                    (off_x, -sy - off_y), 
+                    (off_x + sx, -sy - off_y),
+                    (off_x + sx, -off_y))
+        
+        self.shader_img = get_builtin_shader('IMAGE', '2D')
+        self.batch_img = batch_for_shader(self.shader_img, 'TRI_FAN', 
+        { "pos" : vertices, 
+        "texCoord": ((0, 1), (0, 0), (1, 0), (1, 1)) 
+        },)
+
     def set_mouse_down(self, mouse_down_func):
         self.mouse_down_func = mouse_down_func   
                  
@@ -183,6 +196,8 @@ class BL_UI_Button(BL_UI_Widget):
         return False
     
     def mouse_move(self, x, y):
+        state = self.__state
+
         if self.is_in_rect(x,y):
             if(self.__state != 1):
                 
@@ -190,6 +205,9 @@ class BL_UI_Button(BL_UI_Widget):
                 self.__state = 2
         else:
             self.__state = 0
+
+        if self.__state != state:
+            self.request_redraw()
  
     def mouse_up(self, x, y):
         self._mouse_down = False
@@ -28,6 +28,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
     @text_color.setter
     def text_color(self, value):
         self._text_color = value
+        self.request_redraw()
 
     @property
     def cross_color(self):
@@ -36,6 +37,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
     @cross_color.setter
     def cross_color(self, value):
         self._cross_color = value
+        self.request_redraw()
 
     @property
     def text(self):
@@ -44,6 +46,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
     @text.setter
     def text(self, value):
         self._text = value
+        self.request_redraw()
                 
     @property
     def text_size(self):
@@ -52,6 +55,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self.request_redraw()
 
     @property
     def is_checked(self):
@@ -61,32 +65,28 @@ class BL_UI_Checkbox(BL_UI_Widget):
     def is_checked(self, value):
         if value != self.__state:
             self.__state = value
+            self.request_redraw()
 
             self.call_state_changed()
 
     def update(self, x, y):        
-
-        area_height = self.get_area_height()
-        
-        self.x_screen = x
-        self.y_screen = y
-
         self._textpos = [x + 26, y]
+        super().update(x, y)
 
-        area_height = self.get_area_height()
-        
-        y_screen_flip = area_height - self.y_screen
+    def get_batch_key(self):
+        return self.__boxsize
 
+    def create_batches(self):
         off_x = 0
         off_y = 0
         sx, sy = self.__boxsize 
        
         # top left, top right, ...
         vertices_box = (
-                    (self.x_screen + off_x,      y_screen_flip - off_y - sy), 
-                    (self.x_screen + off_x + sx, y_screen_flip - off_y - sy), 
-                    (self.x_screen + off_x + sx, y_screen_flip - off_y),
-                    (self.x_screen + off_x,      y_screen_flip - off_y))
+                    (off_x,      -off_y - sy), 
+                    (off_x + sx, -off_y - sy), 
+                    (off_x + sx, -off_y),
+                    (off_x,      -off_y))
 
         self.shader = get_builtin_shader('UNIFORM_COLOR', '2D')
         self.batch_box = batch_for_shader(self.shader, 'LINE_LOOP', {"pos": vertices_box})
@@ -95,10 +95,10 @@ class BL_UI_Checkbox(BL_UI_Widget):
 
         # cross top-left, bottom-right | top-right, bottom-left
         vertices_cross = (
-            (self.x_screen + off_x + inset,      y_screen_flip - off_y -  inset), 
-            (self.x_screen + off_x + sx - inset, y_screen_flip - off_y - sy + inset),
-            (self.x_screen + off_x + sx - inset, y_screen_flip - off_y -  inset), 
-            (self.x_screen + off_x + inset, y_screen_flip - off_y - sy + inset))
+            (off_x + inset,      -off_y -  inset), 
+            (off_x + sx - inset, -off_y - sy + inset),
+            (off_x + sx - inset, -off_y -  inset), 
+            (off_x + inset,      -off_y - sy + inset))
 
         self.batch_cross = batch_for_shader(self.shader, 'LINES', {"pos": vertices_cross})
 
@@ -116,12 +116,12 @@ class BL_UI_Checkbox(BL_UI_Widget):
         if self.is_checked:
             gpu.state.line_width_set(3)
             self.shader.uniform_float("color", self._cross_color)
-            self.batch_cross.draw(self.shader) 
+            self.draw_batch(self.batch_cross)
 
         gpu.state.line_width_set(2)
         self.shader.uniform_float("color", self._box_color)
 
-        self.batch_box.draw(self.shader) 
+        self.draw_batch(self.batch_box)
 
         # Draw text
         self.draw_text(area_height)
@@ -131,7 +131,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
 
     def draw_text(self, area_height):
         blf_set_size(0, self._text_size)
-        size = blf.dimensions(0, self._text)
+        size = get_text_dimensions(0, self._text_size, self._text)
 
         textpos_y = area_height - self._textpos[1] - (self.height + size[1]) / 2.0
         blf.position(0, self._textpos[0], textpos_y + 1, 0)
@@ -153,6 +153,9 @@ class BL_UI_Checkbox(BL_UI_Widget):
            
         return False    
 
+    def get_hit_rect(self):
+        return (self.x_screen, self.y_screen, max(self.width, self.__boxsize[0]), max(self.height, self.__boxsize[1]))
+
     def set_state_changed(self, state_changed_func):
         self.state_changed_func = state_changed_func  
  
@@ -164,6 +167,7 @@ class BL_UI_Checkbox(BL_UI_Widget):
 
     def toggle_state(self):
         self.__state = not self.__state
+        self.request_redraw()
 
     def mouse_enter(self, event, x, y):
         super().mouse_enter(event, x, y)
@@ -1,4 +1,5 @@
 from . bl_ui_widget import * 
+from . bl_ui_hit_grid import BL_UI_Hit_Grid
 
 class BL_UI_Drag_Panel(BL_UI_Widget):
     
@@ -8,6 +9,7 @@ class BL_UI_Drag_Panel(BL_UI_Widget):
         self.drag_offset_y = 0
         self.is_drag = False
         self.widgets = []
+        self.hit_grid = BL_UI_Hit_Grid(self.widgets)
 
     def set_location(self, x, y):
         super().set_location(x,y)
@@ -18,6 +20,7 @@ class BL_UI_Drag_Panel(BL_UI_Widget):
         
     def add_widgets(self, widgets):
         self.widgets = widgets
+        self.hit_grid.set_widgets(widgets)
         self.layout_widgets()
         
     def layout_widgets(self):
@@ -28,7 +31,7 @@ class BL_UI_Drag_Panel(BL_UI_Widget):
         super().update(x - self.drag_offset_x, y + self.drag_offset_y)
     
     def child_widget_focused(self, x, y):
-        for widget in self.widgets:
+        for widget in self.hit_grid.widgets_at(x, y):
             if widget.is_in_rect(x, y):
                 return True       
         return False
@@ -2,6 +2,9 @@ import bpy
 
 from bpy.types import Operator
 
+from .. utils.fc_redraw_util import request_redraw, request_redraw_for_event, tag_redraw_if_requested
+from . bl_ui_hit_grid import BL_UI_Hit_Grid
+
 class BL_UI_OT_draw_operator(Operator):
     bl_idname = "object.bl_ui_ot_draw_operator"
     bl_label = "bl ui widgets operator"
@@ -10,13 +13,14 @@ class BL_UI_OT_draw_operator(Operator):
     	
     def __init__(self):
         self.draw_handle = None
-        self.draw_event  = None
         self._finished = False
                 
         self.widgets = []
+        self.hit_grid = BL_UI_Hit_Grid(self.widgets)
 
     def init_widgets(self, context, widgets):
         self.widgets = widgets
+        self.hit_grid.set_widgets(widgets)
         for widget in self.widgets:
             widget.init(context)
 
@@ -35,43 +39,38 @@ class BL_UI_OT_draw_operator(Operator):
         self.register_handlers(args, context)
                    
         context.window_manager.modal_handler_add(self)
+        request_redraw(context)
         return {"RUNNING_MODAL"}
     
     def register_handlers(self, args, context):
         self.draw_handle = bpy.types.SpaceView3D.draw_handler_add(self.draw_callback_px, args, "WINDOW", "POST_PIXEL")
-        self.draw_event = context.window_manager.event_timer_add(0.1, window=context.window)
         
     def unregister_handlers(self, context):
         
-        context.window_manager.event_timer_remove(self.draw_event)
-        
         bpy.types.SpaceView3D.draw_handler_remove(self.draw_handle, "WINDOW")
         
         self.draw_handle = None
-        self.draw_event  = None
         
     def handle_widget_events(self, event):
-        result = False
-        for widget in self.widgets:
-            if widget.handle_event(event):
-                result = True
-        return result
+        return self.hit_grid.handle_event(event)
           
     def modal(self, context, event):
 
         if self._finished:
             return {'FINISHED'}
 
-        if context.area:
-            context.area.tag_redraw()
+        request_redraw_for_event(context, event)
         
+        result = {"PASS_THROUGH"}
         if self.handle_widget_events(event):
-            return {'RUNNING_MODAL'}   
+            result = {'RUNNING_MODAL'}   
         
-        if event.type in {"ESC"}:
+        elif event.type in {"ESC"}:
             self.finish()
+
+        tag_redraw_if_requested(context)
                     
-        return {"PASS_THROUGH"}
+        return result
                                 
     def finish(self):
         self.unregister_handlers(bpy.context)
@@ -0,0 +1,101 @@
+from . bl_ui_widget import set_event_area_height, get_layout_version
+
+class BL_UI_Hit_Grid:
+    '''
+    Uniform grid over the widget rects. Mouse events are only sent to
+    the widgets under the mouse, the widgets that were under it with the
+    last event and the widgets that capture the mouse.
+    '''
+
+    CELL_SIZE = 64
+
+    def __init__(self, widgets=None):
+        self._widgets = widgets if widgets is not None else []
+        self._cells = {}
+        self._layout_key = None
+        self._last_hits = set()
+
+    def set_widgets(self, widgets):
+        self._widgets = widgets
+        self._layout_key = None
+        self._last_hits = set()
+
+    def get_cell_range(self, start, size):
+        return range(int(start // self.CELL_SIZE), int((start + size) // self.CELL_SIZE) + 1)
+
+    def rebuild(self):
+        self._cells = {}
+
+        for index, widget in enumerate(self._widgets):
+            rect = widget.get_hit_rect()
+            if rect is None:
+                continue
+
+            x, y, width, height = rect
+            for cx in self.get_cell_range(x, width):
+                for cy in self.get_cell_range(y, height):
+                    self._cells.setdefault((cx, cy), []).append(index)
+
+    def update_layout(self):
+        # Widgets moved, or the widget list changed
+        layout_key = (get_layout_version(), id(self._widgets), len(self._widgets))
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self._last_hits = {index for index in self._last_hits if index < len(self._widgets)}
+            self.rebuild()
+
+    def get_hits(self, x, y):
+        '''Indices of the widgets whose rect contains the region position'''
+        self.update_layout()
+
+        if not self._widgets:
+            return set()
+
+        y_top = self._widgets[0].get_area_height() - y
+
+        hits = set()
+        for index in self._cells.get((int(x // self.CELL_SIZE), int(y_top // self.CELL_SIZE)), ()):
+            wx, wy, width, height = self._widgets[index].get_hit_rect()
+            if wx <= x <= wx + width and wy <= y_top <= wy + height:
+                hits.add(index)
+
+        return hits
+
+    def widgets_at(self, x, y):
+        return [self._widgets[index] for index in sorted(self.get_hits(x, y))]
+
+    def get_event_widgets(self, event):
+        is_move = event.type == 'MOUSEMOVE'
+        is_press = event.type == 'LEFTMOUSE' and event.value == 'PRESS'
+
+        # Releases and key presses can concern any widget
+        if not (is_move or is_press):
+            return self._widgets
+
+        hits = self.get_hits(event.mouse_region_x, event.mouse_region_y)
+
+        # Widgets the mouse left have to see the event to reset their hover state
+        indices = hits | self._last_hits
+        self._last_hits = hits
+
+        indices.update(index for index, widget in enumerate(self._widgets) if widget.is_captured())
+
+        return [self._widgets[index] for index in sorted(indices)]
+
+    def handle_event(self, event):
+        '''Sends the event to the widgets it can concern, True if one of them handled it'''
+        if not self._widgets:
+            return False
+
+        # One area lookup for all widgets of this event
+        set_event_area_height(self._widgets[0].get_area_height())
+
+        try:
+            result = False
+            for widget in self.get_event_widgets(event):
+                if widget.handle_event(event):
+                    result = True
+        finally:
+            set_event_area_height(None)
+
+        return result
@@ -20,6 +20,7 @@ class BL_UI_Label(BL_UI_Widget):
     @text_color.setter
     def text_color(self, value):
         self._text_color = value
+        self.request_redraw()
 
     @property
     def text(self):
@@ -28,6 +29,7 @@ class BL_UI_Label(BL_UI_Widget):
     @text.setter
     def text(self, value):
         self._text = value
+        self.request_redraw()
 
     @property
     def text_size(self):
@@ -36,9 +38,13 @@ class BL_UI_Label(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self.request_redraw()
             
     def is_in_rect(self, x, y):
         return False
+
+    def get_hit_rect(self):
+        return None
         
     def draw(self):
         if not self.visible:
@@ -47,7 +53,7 @@ class BL_UI_Label(BL_UI_Widget):
         area_height = self.get_area_height()
 
         blf_set_size(0, self._text_size)
-        size = blf.dimensions(0, self._text)
+        size = get_text_dimensions(0, self._text_size, self._text)
     
         textpos_y = area_height - self.y_screen - self.height
         blf.position(0, self.x_screen, textpos_y, 0)
@@ -42,6 +42,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @text_color.setter
     def text_color(self, value):
         self._text_color = value
+        self.request_redraw()
 
     @property
     def text_size(self):
@@ -50,6 +51,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self.request_redraw()
 
     @property
     def color(self):
@@ -58,6 +60,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @color.setter
     def color(self, value):
         self._color = value
+        self.request_redraw()
 
     @property
     def hover_color(self):
@@ -66,6 +69,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @hover_color.setter
     def hover_color(self, value):
         self._hover_color = value
+        self.request_redraw()
 
     @property
     def select_color(self):
@@ -74,6 +78,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @select_color.setter
     def select_color(self, value):
         self._select_color = value
+        self.request_redraw()
 
     @property
     def min(self):
@@ -82,6 +87,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @min.setter
     def min(self, value):
         self._min = value
+        self.request_redraw()
 
     @property
     def max(self):
@@ -90,6 +96,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @max.setter
     def max(self, value):
         self._max = value
+        self.request_redraw()
 
     @property
     def decimals(self):
@@ -98,6 +105,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @decimals.setter
     def decimals(self, value):
         self._decimals = value
+        self.request_redraw()
 
     @property
     def show_min_max(self):
@@ -106,6 +114,7 @@ class BL_UI_Slider(BL_UI_Widget):
     @show_min_max.setter
     def show_min_max(self, value):
         self._show_min_max = value
+        self.request_redraw()
                 
     def draw(self):      
         if not self.visible:
@@ -129,12 +138,12 @@ class BL_UI_Slider(BL_UI_Widget):
         # Draw background
         self.shader.uniform_float("color", self._bg_color)
         gpu.state.blend_set('ALPHA')
-        self.batch_bg.draw(self.shader)
+        self.draw_batch(self.batch_bg)
 
         # Draw slider   
         self.shader.uniform_float("color", color)
         
-        self.batch_slider.draw(self.shader) 
+        self.draw_batch(self.batch_slider, (self.__slider_pos, 0))
         gpu.state.blend_set('NONE')    
         
         # Draw value text
@@ -142,7 +151,7 @@ class BL_UI_Slider(BL_UI_Widget):
         blf_set_size(0, self._text_size)
         
         sValue = sFormat.format(self.__slider_value)
-        size = blf.dimensions(0, sValue)
+        size = get_text_dimensions(0, self._text_size, sValue)
                       
         blf.position(0, self.__slider_pos + 1 + self.x_screen - size[0] / 2.0, 
                         area_height - self.y_screen + self.__slider_offset_y, 0)
@@ -153,7 +162,7 @@ class BL_UI_Slider(BL_UI_Widget):
         if self._show_min_max:
             sMin = sFormat.format(self._min)
             
-            size = blf.dimensions(0, sMin)
+            size = get_text_dimensions(0, self._text_size, sMin)
                         
             blf.position(0, self.x_screen - size[0] / 2.0, 
                             area_height - self.height - self.y_screen, 0)
@@ -161,7 +170,7 @@ class BL_UI_Slider(BL_UI_Widget):
 
             sMax = sFormat.format(self._max)
             
-            size = blf.dimensions(0, sMax)
+            size = get_text_dimensions(0, self._text_size, sMax)
 
             r, g, b, a = self._text_color
             blf.color(0, r, g, b, a)
@@ -171,63 +180,52 @@ class BL_UI_Slider(BL_UI_Widget):
             blf.draw(0, sMax)
 
 
-    def update_slider(self):
-        # Slider triangles
+    def get_batch_key(self):
+        return (self.width, self.height, self.__slider_width, self.__slider_height, self.__slider_offset_y)
+
+    def create_batches(self):
+        # Min                      Max
+        #  |---------V--------------|
+
+        self.shader = get_builtin_shader('UNIFORM_COLOR','2D')
+
+        # Slider triangles, moved by the slider position when drawn
         # 
         #        0
         #     1 /\ 2
         #      |  |
         #     3---- 4
 
-        # batch for slider
-        area_height = self.get_area_height()
-
         h = self.__slider_height
         w = self.__slider_width
-        pos_y = area_height - self.y_screen - self.height / 2.0 + self.__slider_height / 2.0 + self.__slider_offset_y
-        pos_x = self.x_screen + self.__slider_pos
+        pos_y = -self.height / 2.0 + self.__slider_height / 2.0 + self.__slider_offset_y
         
         indices = ((0, 1, 2), (1, 2, 3), (3, 2, 4))
         
         vertices = (
-                    (pos_x    , pos_y    ),
-                    (pos_x - w, pos_y - w),
-                    (pos_x + w, pos_y - w),
-                    (pos_x - w, pos_y - h),
-                    (pos_x + w, pos_y - h)
+                    (0, pos_y    ),
+                    (-w, pos_y - w),
+                    (w, pos_y - w),
+                    (-w, pos_y - h),
+                    (w, pos_y - h)
                    )
                     
-        self.shader = get_builtin_shader('UNIFORM_COLOR','2D')
         self.batch_slider = batch_for_shader(self.shader, 'TRIS', 
         {"pos" : vertices}, indices=indices)
-        
-    def update(self, x, y): 
-
-        area_height = self.get_area_height()
-        
-        # Min                      Max
-        #  |---------V--------------|
-        
-        self.x_screen = x
-        self.y_screen = y
-        
-        self.update_slider()
 
         # batch for background
-        pos_y = area_height - self.y_screen - self.height / 2.0
-        pos_x = self.x_screen
+        pos_y = -self.height / 2.0
 
         indices = ((0, 1, 2), (0, 2, 3))
 
         # bottom left, top left, top right, bottom right
         vertices = (
-                    (pos_x, pos_y), 
-                    (pos_x, pos_y + 4), 
-                    (pos_x + self.width, pos_y + 4),
-                    (pos_x + self.width, pos_y)
+                    (0, pos_y), 
+                    (0, pos_y + 4), 
+                    (self.width, pos_y + 4),
+                    (self.width, pos_y)
         )
 
-
         self.batch_bg = batch_for_shader(self.shader, 'TRIS', {"pos" : vertices}, indices=indices)
  
     def set_value_change(self, value_change_func):
@@ -246,6 +244,15 @@ class BL_UI_Slider(BL_UI_Widget):
            
         return False
 
+    def get_hit_rect(self):
+        # The slider can stick out of the widget
+        w = self.__slider_width
+        h = self.__slider_height + self.__slider_offset_y
+        return (self.x_screen - w, self.y_screen - h, self.width + 2 * w, self.height + 2 * h)
+
+    def is_captured(self):
+        return self.__is_drag
+
     def __value_to_pos(self, value):
         return self.width * (value - self._min) / (self._max - self._min)
 
@@ -270,12 +277,12 @@ class BL_UI_Slider(BL_UI_Widget):
                 pass
 
             self.__slider_pos = self.__value_to_pos(self.__slider_value)
-
-            if self.context is not None:
-                self.update_slider()
+            self.request_redraw()
 
 
     def __set_slider_pos(self, x):
+        slider_pos = self.__slider_pos
+
         if x <= self.x_screen:
             self.__slider_pos = 0
         elif x >= self.x_screen + self.width:
@@ -283,6 +290,9 @@ class BL_UI_Slider(BL_UI_Widget):
         else:
             self.__slider_pos = x - self.x_screen
 
+        if self.__slider_pos != slider_pos:
+            self.request_redraw()
+
         newValue = self.__pos_to_value(self.__slider_pos)
 
         if newValue != self.__slider_value:
@@ -303,6 +313,8 @@ class BL_UI_Slider(BL_UI_Widget):
         return False
     
     def mouse_move(self, x, y):
+        state = self.__state
+
         if self.is_in_rect(x,y):
             if(self.__state != 1):
                 
@@ -310,10 +322,12 @@ class BL_UI_Slider(BL_UI_Widget):
                 self.__state = 2
         else:
             self.__state = 0
+
+        if self.__state != state:
+            self.request_redraw()
         
         if self.__is_drag:
             self.__set_slider_pos(x)
-            self.update(self.x_screen, self.y_screen)
  
     def mouse_up(self, x, y):
         super().mouse_up(x,y)
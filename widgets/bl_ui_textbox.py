@@ -41,6 +41,7 @@ class BL_UI_Textbox(BL_UI_Widget):
     @carret_color.setter
     def carret_color(self, value):
         self._carret_color = value
+        self.request_redraw()
 
     @property
     def text_color(self):
@@ -49,6 +50,7 @@ class BL_UI_Textbox(BL_UI_Widget):
     @text_color.setter
     def text_color(self, value):
         self._text_color = value
+        self.request_redraw()
 
     @property
     def max_input_chars(self):
@@ -70,6 +72,8 @@ class BL_UI_Textbox(BL_UI_Widget):
         if self.context is not None:
             self.update_carret()
 
+        self.request_redraw()
+
     @property
     def label(self):
         return self._label
@@ -79,6 +83,7 @@ class BL_UI_Textbox(BL_UI_Widget):
         self._label = value
         if self.context is not None:
             self.update_label()
+        self.request_redraw()
 
     @property
     def text_size(self):
@@ -87,6 +92,7 @@ class BL_UI_Textbox(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self.request_redraw()
 
     @property
     def has_label(self):
@@ -102,57 +108,57 @@ class BL_UI_Textbox(BL_UI_Widget):
 
     def update(self, x, y):
         super().update(x, y)
+        self._textpos = [x, y]
+
+    def create_batches(self):
+        super().create_batches()
 
         if self.has_label:       
             self.update_label()
 
-        self._textpos = [x, y]
         self.update_carret()
 
     def update_label(self):
-        y_screen_flip = self.get_area_height() - self.y_screen
-
-        size = blf.dimensions(0, self._label)
+        size = get_text_dimensions(0, self._text_size, self._label)
 
         self._label_width = size[0] + 12
 
         # bottom left, top left, top right, bottom right
         vertices_outline = (
-                    (self.x_screen, y_screen_flip), 
-                    (self.x_screen + self.width + self._label_width, y_screen_flip), 
-                    (self.x_screen + self.width + self._label_width, y_screen_flip - self.height),
-                    (self.x_screen, y_screen_flip - self.height))
+                    (0, 0), 
+                    (self.width + self._label_width, 0), 
+                    (self.width + self._label_width, -self.height),
+                    (0, -self.height))
                     
         self.batch_outline = batch_for_shader(self.shader, 'LINE_LOOP', {"pos" : vertices_outline})
 
         indices = ((0, 1, 2), (2, 3, 1))
 
-        lb_x = self.x_screen + self.width
+        lb_x = self.width
 
         # bottom left, top left, top right, bottom right
         vertices_label_bg = (
-                    (lb_x, y_screen_flip), 
-                    (lb_x + self._label_width, y_screen_flip), 
-                    (lb_x, y_screen_flip - self.height),
-                    (lb_x + self._label_width, y_screen_flip - self.height))
+                    (lb_x, 0), 
+                    (lb_x + self._label_width, 0), 
+                    (lb_x, -self.height),
+                    (lb_x + self._label_width, -self.height))
                     
         self.batch_label_bg = batch_for_shader(self.shader, 'TRIS', {"pos" : vertices_label_bg}, indices=indices)
 
     def get_carret_pos_px(self):
-        size_all = blf.dimensions(0, self._text)
-        size_to_carret = blf.dimensions(0, self._text[:self._carret_pos])
-        return self.x_screen + (self.width / 2.0) - (size_all[0] / 2.0) + size_to_carret[0]
+        size_all = get_text_dimensions(0, self._text_size, self._text)
+        size_to_carret = get_text_dimensions(0, self._text_size, self._text[:self._carret_pos])
+        return (self.width / 2.0) - (size_all[0] / 2.0) + size_to_carret[0]
 
     def update_carret(self):
 
-        y_screen_flip = self.get_area_height() - self.y_screen
-
+        # Relative to the widget, only changes with the text
         x = self.get_carret_pos_px()
 
         # bottom left, top left, top right, bottom right
         vertices = (
-            (x, y_screen_flip - 6),
-            (x, y_screen_flip - self.height + 6)
+            (x, -6),
+            (x, -self.height + 6)
         )
 
         self.batch_carret = batch_for_shader(
@@ -174,16 +180,16 @@ class BL_UI_Textbox(BL_UI_Widget):
         self.shader.uniform_float("color", self._carret_color)
         gpu.state.blend_set('ALPHA')
         gpu.state.line_width_set(2)
-        self.batch_carret.draw(self.shader)
+        self.draw_batch(self.batch_carret)
 
         if self.has_label:
             self.shader.uniform_float("color", self._label_color)
             gpu.state.line_width_set(1)
-            self.batch_outline.draw(self.shader)
+            self.draw_batch(self.batch_outline)
 
-            self.batch_label_bg.draw(self.shader)
+            self.draw_batch(self.batch_label_bg)
 
-            size = blf.dimensions(0, self._label)
+            size = get_text_dimensions(0, self._text_size, self._label)
 
             textpos_y = area_height - self.y_screen - (self.height + size[1]) / 2.0
             blf.position(0, self.x_screen + self.width + (self._label_width / 2.0) - (size[0]  / 2.0), textpos_y + 1, 0)
@@ -201,7 +207,7 @@ class BL_UI_Textbox(BL_UI_Widget):
 
     def draw_text(self, area_height):
         blf_set_size(0, self._text_size)
-        size = blf.dimensions(0, self._text)
+        size = get_text_dimensions(0, self._text_size, self._text)
 
         textpos_y = area_height - self._textpos[1] - (self.height + size[1]) / 2.0
         blf.position(0, self._textpos[0] + (self.width - size[0]) / 2.0, textpos_y + 1, 0)
@@ -288,7 +294,8 @@ class BL_UI_Textbox(BL_UI_Widget):
                 elif dist_abs > 0:
                     val += 1 * s
 
-                self._text =  "{0:.2f}".format(val)
+                # The setter moves the carret and rebuilds its batch
+                self.text = "{0:.2f}".format(val)
 
                 self._x_start_value = x
 
@@ -43,6 +43,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @text_color.setter
     def text_color(self, value):
         self._text_color = value
+        self.request_redraw()
 
     @property
     def text_size(self):
@@ -51,6 +52,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @text_size.setter
     def text_size(self, value):
         self._text_size = value
+        self.request_redraw()
 
     @property
     def color(self):
@@ -59,6 +61,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @color.setter
     def color(self, value):
         self._color = value
+        self.request_redraw()
 
     @property
     def hover_color(self):
@@ -67,6 +70,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @hover_color.setter
     def hover_color(self, value):
         self._hover_color = value
+        self.request_redraw()
 
     @property
     def select_color(self):
@@ -75,6 +79,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @select_color.setter
     def select_color(self, value):
         self._select_color = value
+        self.request_redraw()
 
     @property
     def min(self):
@@ -83,6 +88,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @min.setter
     def min(self, value):
         self._min = value
+        self.request_redraw()
 
     @property
     def max(self):
@@ -91,6 +97,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @max.setter
     def max(self, value):
         self._max = value
+        self.request_redraw()
 
     @property
     def decimals(self):
@@ -99,6 +106,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
     @decimals.setter
     def decimals(self, value):
         self._decimals = value
+        self.request_redraw()
 
     def draw(self):
 
@@ -122,7 +130,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
 
         self.shader.uniform_float("color", color)
         
-        self.batch_up.draw(self.shader)
+        self.draw_batch(self.batch_up)
 
         color = self._color
 
@@ -135,14 +143,14 @@ class BL_UI_Up_Down(BL_UI_Widget):
             color = self._hover_color
 
         self.shader.uniform_float("color", color)
-        self.batch_down.draw(self.shader)        
+        self.draw_batch(self.batch_down)
         
         # Draw value text
         sFormat = "{:0." + str(self._decimals) + "f}"
         blf_set_size(0, self._text_size)
         
         sValue = sFormat.format(self.__up_down_value)
-        size = blf.dimensions(0, sValue)
+        size = get_text_dimensions(0, self._text_size, sValue)
 
         y_pos = area_height - self.y_screen - size[1] - 2
         x_pos = self.x_screen + 2 * self.__up_down_width + 10
@@ -154,20 +162,18 @@ class BL_UI_Up_Down(BL_UI_Widget):
             
         blf.draw(0, sValue)
 
-    def create_up_down_buttons(self):
+    def create_batches(self):
         # Up / down triangle
         # 
         #        0
         #     1 /\ 2
         #       --
 
-        area_height = self.get_area_height()
-
         h = self.__up_down_height
         w = self.__up_down_width / 2.0
         
-        pos_y = area_height - self.y_screen
-        pos_x = self.x_screen
+        pos_y = 0
+        pos_x = 0
                
         vertices_up = (
                     (pos_x + w  , pos_y    ),
@@ -187,14 +193,6 @@ class BL_UI_Up_Down(BL_UI_Widget):
         self.shader = get_builtin_shader('UNIFORM_COLOR', '2D')
         self.batch_up = batch_for_shader(self.shader, 'TRIS', {"pos" : vertices_up})
         self.batch_down = batch_for_shader(self.shader, 'TRIS', {"pos" : vertices_down})
-        
-    def update(self, x, y): 
-
-        self.x_screen = x
-        self.y_screen = y
-       
-        self.create_up_down_buttons()
-
  
     def set_value_change(self, value_change_func):
         self.value_change_func = value_change_func
@@ -229,6 +227,9 @@ class BL_UI_Up_Down(BL_UI_Widget):
     def is_in_rect(self, x, y):
         return self.is_in_up(x,y) or self.is_in_down(x,y)
 
+    def get_hit_rect(self):
+        return (self.x_screen, self.y_screen, 2 * self.__up_down_width + 2, self.__up_down_height)
+
     def set_value(self, value):
         if value < self._min:
             value = self._min
@@ -237,6 +238,7 @@ class BL_UI_Up_Down(BL_UI_Widget):
 
         if value != self.__up_down_value:
             self.__up_down_value = round(value, self._decimals)
+            self.request_redraw()
 
             try:
                 self.value_change_func(self, self.__up_down_value)
@@ -263,6 +265,8 @@ class BL_UI_Up_Down(BL_UI_Widget):
         self.set_value(self.__up_down_value - 1)
     
     def mouse_move(self, x, y):
+        state = self.__state
+
         if self.is_in_up(x,y):
             if(self.__state != 1):
                 
@@ -277,6 +281,9 @@ class BL_UI_Up_Down(BL_UI_Widget):
 
         else:
             self.__state = 0
+
+        if self.__state != state:
+            self.request_redraw()
  
     def mouse_up(self, x, y):
         super().mouse_up(x,y)
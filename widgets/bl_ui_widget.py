@@ -3,6 +3,19 @@ import gpu
 from gpu_extras.batch import batch_for_shader
 
 from .. utils.shader_utils import *
+from .. utils.fc_redraw_util import request_redraw
+
+# Area height while an event is dispatched and layout changes, see BL_UI_Hit_Grid
+_widget_state = {
+    "area_height": None,
+    "layout_version": 0
+}
+
+def set_event_area_height(area_height):
+    _widget_state["area_height"] = area_height
+
+def get_layout_version():
+    return _widget_state["layout_version"]
 
 class BL_UI_Widget:
     
@@ -19,6 +32,8 @@ class BL_UI_Widget:
         self.__inrect = False
         self._mouse_down = False
         self._is_visible = True
+        self._batch_key = None
+        self._layout_key = None
 
     def set_location(self, x, y):
         self.x = x
@@ -34,6 +49,7 @@ class BL_UI_Widget:
     @bg_color.setter
     def bg_color(self, value):
         self._bg_color = value
+        self.request_redraw()
 
     @property
     def visible(self):
@@ -42,6 +58,7 @@ class BL_UI_Widget:
     @visible.setter
     def visible(self, value):
         self._is_visible = value
+        self.request_redraw()
 
     @property
     def tag(self):
@@ -59,33 +76,64 @@ class BL_UI_Widget:
         self.shader.uniform_float("color", self._bg_color)
         
         gpu.state.blend_set('ALPHA')
-        self.batch_panel.draw(self.shader) 
+        self.draw_batch(self.batch_panel)
         gpu.state.blend_set('NONE')
 
+    def draw_batch(self, batch, offset=(0, 0), shader=None):
+        x, y = self.get_screen_origin()
+
+        with gpu.matrix.push_pop():
+            gpu.matrix.translate((x + offset[0], y + offset[1]))
+            batch.draw(shader or self.shader)
+
     def init(self, context):
         self.context = context
         self.update(self.x, self.y)
     
     def update(self, x, y):
         
-        area_height = self.get_area_height()
-        
         self.x_screen = x
         self.y_screen = y
-                
-        indices = ((0, 1, 2), (0, 2, 3))
 
-        y_screen_flip = area_height - self.y_screen
+        # Shapes place their panel on every draw, only a move or resize changes the layout
+        layout_key = (x, y, self.get_hit_rect())
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            _widget_state["layout_version"] += 1
+            self.request_redraw()
+
+        # The batches are in widget coordinates, moving the widget
+        # only changes the translation they are drawn with
+        batch_key = self.get_batch_key()
+        if batch_key != self._batch_key:
+            self._batch_key = batch_key
+            self.create_batches()
+
+    def get_batch_key(self):
+        return (self.width, self.height)
+
+    def create_batches(self):
+        indices = ((0, 1, 2), (0, 2, 3))
 
         # bottom left, top left, top right, bottom right
         vertices = (
-                    (self.x_screen, y_screen_flip), 
-                    (self.x_screen, y_screen_flip - self.height), 
-                    (self.x_screen + self.width, y_screen_flip - self.height),
-                    (self.x_screen + self.width, y_screen_flip))
+                    (0, 0), 
+                    (0, -self.height), 
+                    (self.width, -self.height),
+                    (self.width, 0))
                     
         self.shader = get_builtin_shader('UNIFORM_COLOR', '2D')
         self.batch_panel = batch_for_shader(self.shader, 'TRIS', {"pos" : vertices}, indices=indices)
+
+    def request_redraw(self):
+        '''Mouse moves only redraw the area if a widget changed what it draws'''
+        context = getattr(self, "context", None)
+        if context is not None:
+            request_redraw(context)
+
+    def get_screen_origin(self):
+        '''Top left corner of the widget in region coordinates'''
+        return (self.x_screen, self.get_area_height() - self.y_screen)
     
     def handle_event(self, event):
         x = event.mouse_region_x
@@ -124,8 +172,20 @@ class BL_UI_Widget:
         return []
 
     def get_area_height(self):
+        area_height = _widget_state["area_height"]
+        if area_height is not None:
+            return area_height
+
         return self.context.area.height    
 
+    def get_hit_rect(self):
+        '''Rect that contains every point is_in_rect can accept, top down in screen coordinates'''
+        return (self.x_screen, self.y_screen, self.width, self.height)
+
+    def is_captured(self):
+        '''True while the widget needs all mouse events, like during a drag'''
+        return self._mouse_down
+
     def is_in_rect(self, x, y):
         area_height = self.get_area_height()
 
@@ -160,6 +220,7 @@ class BL_UI_Widget:
 
     def mouse_enter(self, event, x, y):
         self.call_mouse_enter()
+        self.request_redraw()
 
     def set_mouse_exit(self, mouse_exit_func):
         self.mouse_exit_func = mouse_exit_func  
@@ -173,6 +234,7 @@ class BL_UI_Widget:
 
     def mouse_exit(self, event, x, y):
         self.call_mouse_exit()
+        self.request_redraw()
 
     def mouse_move(self, x, y):
         pass
\ No newline at end of file